@@ -1,6 +1,8 @@
 import json
 import sqlite3
 import threading
+import uuid
+import zlib
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -25,17 +27,55 @@ ALLOWED_JOB_UPDATE_FIELDS = {
     "script_snapshot_json",
     "task_metadata_json",
 }
+# Bump on every DDL change: initialize() skips the DDL at this version.
+SCHEMA_VERSION = 6
+# One-way upgrade: msh_text and results_json hold zlib bytes despite their TEXT
+# declarations, so older builds cannot read artifacts or results written here.
+# NULL encoding marks legacy plain-text rows.
+BLOB_ENCODING = "zlib"
+
+
+def _encode_blob(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), 1)
+
+
+def _decode_blob(value: Any, encoding: Optional[str]) -> str:
+    if encoding == BLOB_ENCODING:
+        return zlib.decompress(value).decode("utf-8")
+    return value
 
 
 class SimulationDB:
-    def __init__(self, db_path: Path):
-        self.db_path = Path(db_path)
+    def __init__(self, db_path: Optional[Path]):
+        self.db_path = Path(db_path) if db_path is not None else None
         self._lock = threading.RLock()
+        # Per-thread connection of an open transaction() block.
+        self._transaction = threading.local()
+        self._uri: Optional[str] = None
+        self._keepalive: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def in_memory(cls) -> "SimulationDB":
+        db = cls(None)
+        db._uri = f"file:simulation-db-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        # Held open so the shared-cache database outlives per-call connections.
+        db._keepalive = sqlite3.connect(db._uri, uri=True, check_same_thread=False)
+        return db
+
+    def close(self) -> None:
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
 
     def initialize(self) -> None:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         with self._managed_connection() as conn:
             conn.execute("PRAGMA foreign_keys = ON")
+            # Schema already current: skip the DDL.
+            if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+                return
+            conn.execute("BEGIN")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS simulation_jobs (
@@ -67,6 +107,7 @@ class SimulationDB:
                 CREATE TABLE IF NOT EXISTS simulation_results (
                   job_id TEXT PRIMARY KEY,
                   results_json TEXT NOT NULL,
+                  results_encoding TEXT,
                   FOREIGN KEY(job_id) REFERENCES simulation_jobs(id) ON DELETE CASCADE
                 )
                 """
@@ -76,6 +117,7 @@ class SimulationDB:
                 CREATE TABLE IF NOT EXISTS simulation_artifacts (
                   job_id TEXT PRIMARY KEY,
                   msh_text TEXT,
+                  msh_encoding TEXT,
                   FOREIGN KEY(job_id) REFERENCES simulation_jobs(id) ON DELETE CASCADE
                 )
                 """
@@ -96,11 +138,30 @@ class SimulationDB:
                 conn.execute("ALTER TABLE simulation_jobs ADD COLUMN script_snapshot_json TEXT")
             if "task_metadata_json" not in columns:
                 conn.execute("ALTER TABLE simulation_jobs ADD COLUMN task_metadata_json TEXT")
-            conn.execute("PRAGMA user_version = 4")
+            result_columns = {
+                row["name"]
+                for row in conn.execute("PRAGMA table_info(simulation_results)").fetchall()
+            }
+            if "results_encoding" not in result_columns:
+                conn.execute("ALTER TABLE simulation_results ADD COLUMN results_encoding TEXT")
+            artifact_columns = {
+                row["name"]
+                for row in conn.execute("PRAGMA table_info(simulation_artifacts)").fetchall()
+            }
+            if "msh_encoding" not in artifact_columns:
+                conn.execute("ALTER TABLE simulation_artifacts ADD COLUMN msh_encoding TEXT")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def create_job(self, job: Dict[str, Any], *, preserialized: bool = False) -> None:
+        self.create_jobs([job], preserialized=preserialized)
 
-    def create_job(self, job: Dict[str, Any]) -> None:
+    def create_jobs(self, jobs: List[Dict[str, Any]], *, preserialized: bool = False) -> None:
+        # preserialized: config_json/config_summary_json are already JSON strings.
+        rows = [self._job_insert_row(job, preserialized) for job in jobs]
+        if not rows:
+            return
         with self._lock, self._managed_connection() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO simulation_jobs (
                   id, status, created_at, updated_at, queued_at,
@@ -110,30 +171,39 @@ class SimulationDB:
                   script_snapshot_json, task_metadata_json
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    job["id"],
-                    job["status"],
-                    job["created_at"],
-                    job["updated_at"],
-                    job["queued_at"],
-                    job.get("started_at"),
-                    job.get("completed_at"),
-                    float(job.get("progress", 0.0)),
-                    job.get("stage"),
-                    job.get("stage_message"),
-                    job.get("error_message"),
-                    1 if job.get("cancellation_requested") else 0,
-                    json.dumps(job["config_json"]),
-                    json.dumps(job["config_summary_json"]),
-                    1 if job.get("has_results") else 0,
-                    1 if job.get("has_mesh_artifact") else 0,
-                    json.dumps(job["mesh_stats"]) if job.get("mesh_stats") is not None else None,
-                    job.get("label"),
-                    json.dumps(job.get("script_snapshot")) if job.get("script_snapshot") is not None else None,
-                    json.dumps(job.get("task_metadata") or {}),
-                ),
+                rows,
             )
 
+    @staticmethod
+    def _job_insert_row(job: Dict[str, Any], preserialized: bool = False) -> Tuple[Any, ...]:
+        config_json = job["config_json"]
+        config_summary_json = job["config_summary_json"]
+        if not preserialized:
+            config_json = json.dumps(config_json)
+            config_summary_json = json.dumps(config_summary_json)
+        return (
+            job["id"],
+            job["status"],
+            job["created_at"],
+            job["updated_at"],
+            job["queued_at"],
+            job.get("started_at"),
+            job.get("completed_at"),
+            float(job.get("progress", 0.0)),
+            job.get("stage"),
+            job.get("stage_message"),
+            job.get("error_message"),
+            1 if job.get("cancellation_requested") else 0,
+            config_json,
+            config_summary_json,
+            1 if job.get("has_results") else 0,
+            1 if job.get("has_mesh_artifact") else 0,
+            json.dumps(job["mesh_stats"]) if job.get("mesh_stats") is not None else None,
+            job.get("label"),
+            json.dumps(job.get("script_snapshot")) if job.get("script_snapshot") is not None else None,
+            json.dumps(job.get("task_metadata") or {}),
+        )
+
     def update_job(self, job_id: str, **fields: Any) -> bool:
         if not fields:
             return False
@@ -199,6 +269,7 @@ class SimulationDB:
         return [self._row_to_job(row) for row in rows], int(total)
 
     def store_results(self, job_id: str, results: Dict[str, Any]) -> None:
+        results_blob = _encode_blob(json.dumps(results, separators=(",", ":")))
         with self._lock, self._managed_connection() as conn:
             exists = conn.execute(
                 "SELECT 1 FROM simulation_jobs WHERE id = ?",
@@ -208,12 +279,13 @@ class SimulationDB:
                 return
             conn.execute(
                 """
-                INSERT INTO simulation_results (job_id, results_json)
-                VALUES (?, ?)
+                INSERT INTO simulation_results (job_id, results_json, results_encoding)
+                VALUES (?, ?, ?)
                 ON CONFLICT(job_id) DO UPDATE SET
-                  results_json = excluded.results_json
+                  results_json = excluded.results_json,
+                  results_encoding = excluded.results_encoding
                 """,
-                (job_id, json.dumps(results)),
+                (job_id, results_blob, BLOB_ENCODING),
             )
             conn.execute(
                 "UPDATE simulation_jobs SET has_results = 1, updated_at = ? WHERE id = ?",
@@ -223,14 +295,15 @@ class SimulationDB:
     def get_results(self, job_id: str) -> Optional[Dict[str, Any]]:
         with self._lock, self._managed_connection() as conn:
             row = conn.execute(
-                "SELECT results_json FROM simulation_results WHERE job_id = ?",
+                "SELECT results_json, results_encoding FROM simulation_results WHERE job_id = ?",
                 (job_id,),
             ).fetchone()
             if not row:
                 return None
-            return json.loads(row["results_json"])
+            return json.loads(_decode_blob(row["results_json"], row["results_encoding"]))
 
     def store_mesh_artifact(self, job_id: str, msh_text: str) -> None:
+        msh_blob = _encode_blob(msh_text)
         with self._lock, self._managed_connection() as conn:
             exists = conn.execute(
                 "SELECT 1 FROM simulation_jobs WHERE id = ?",
@@ -240,12 +313,13 @@ class SimulationDB:
                 return
             conn.execute(
                 """
-                INSERT INTO simulation_artifacts (job_id, msh_text)
-                VALUES (?, ?)
+                INSERT INTO simulation_artifacts (job_id, msh_text, msh_encoding)
+                VALUES (?, ?, ?)
                 ON CONFLICT(job_id) DO UPDATE SET
-                  msh_text = excluded.msh_text
+                  msh_text = excluded.msh_text,
+                  msh_encoding = excluded.msh_encoding
                 """,
-                (job_id, msh_text),
+                (job_id, msh_blob, BLOB_ENCODING),
             )
             conn.execute(
                 "UPDATE simulation_jobs SET has_mesh_artifact = 1, updated_at = ? WHERE id = ?",
@@ -255,12 +329,12 @@ class SimulationDB:
     def get_mesh_artifact(self, job_id: str) -> Optional[str]:
         with self._lock, self._managed_connection() as conn:
             row = conn.execute(
-                "SELECT msh_text FROM simulation_artifacts WHERE job_id = ?",
+                "SELECT msh_text, msh_encoding FROM simulation_artifacts WHERE job_id = ?",
                 (job_id,),
             ).fetchone()
             if not row:
                 return None
-            return row["msh_text"]
+            return _decode_blob(row["msh_text"], row["msh_encoding"])
 
     def delete_job(self, job_id: str) -> bool:
         with self._lock, self._managed_connection() as conn:
@@ -347,13 +421,40 @@ class SimulationDB:
         return deleted
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        if self._uri is not None:
+            conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         return conn
 
+    @contextmanager
+    def transaction(self):
+        # Nested blocks join the outermost transaction.
+        if getattr(self._transaction, "conn", None) is not None:
+            yield
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                self._transaction.conn = conn
+                yield
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._transaction.conn = None
+                conn.close()
+
     @contextmanager
     def _managed_connection(self):
+        conn = getattr(self._transaction, "conn", None)
+        if conn is not None:
+            yield conn
+            return
         conn = self._connect()
         try:
             yield conn
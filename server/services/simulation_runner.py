@@ -10,6 +10,8 @@ import tempfile
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
+
 from contracts import SimulationRequest, WaveguideParamsRequest
 from services.simulation_validation import (
     is_hornlab_mesher_strategy,
@@ -172,9 +174,10 @@ def _build_mesh_stats(
         }
     if isinstance(surface_tags, list):
         tag_counts = {1: 0, 2: 0, 3: 0, 4: 0}
-        for raw_tag in surface_tags:
-            tag = int(raw_tag)
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        unique_tags, tag_totals = np.unique(
+            np.asarray(surface_tags, dtype=np.int32), return_counts=True
+        )
+        tag_counts.update(zip(unique_tags.tolist(), tag_totals.tolist()))
         mesh_stats["tag_counts"] = tag_counts
     metadata_identity_counts = (
         metadata.get("identityTriangleCounts")
@@ -212,31 +215,23 @@ def _build_mesh_stats(
 def _build_vertex_bounds(
     vertices: list[Any],
 ) -> Optional[tuple[float, float, float, float, float, float]]:
-    if len(vertices) < 3:
+    count = len(vertices) // 3
+    if count == 0:
         return None
 
-    min_x = min_y = min_z = float("inf")
-    max_x = max_y = max_z = float("-inf")
-    found = False
-    for index in range(0, len(vertices) - 2, 3):
-        try:
-            x = float(vertices[index])
-            y = float(vertices[index + 1])
-            z = float(vertices[index + 2])
-        except (TypeError, ValueError):
-            continue
-        if not all(math.isfinite(value) for value in (x, y, z)):
-            continue
-        min_x = min(min_x, x)
-        min_y = min(min_y, y)
-        min_z = min(min_z, z)
-        max_x = max(max_x, x)
-        max_y = max(max_y, y)
-        max_z = max(max_z, z)
-        found = True
-
-    if not found:
+    flat = vertices[: count * 3]
+    try:
+        points = np.asarray(flat, dtype=float)
+    except (TypeError, ValueError):
+        # Unparseable coordinates become NaN so their vertex is dropped below
+        # exactly like a non-finite one.
+        points = np.array([_finite_float(value, math.nan) for value in flat])
+    points = points.reshape(count, 3)
+    points = points[np.isfinite(points).all(axis=1)]
+    if points.shape[0] == 0:
         return None
+    min_x, min_y, min_z = (float(value) for value in points.min(axis=0))
+    max_x, max_y, max_z = (float(value) for value in points.max(axis=0))
     return min_x, min_y, min_z, max_x, max_y, max_z
 
 
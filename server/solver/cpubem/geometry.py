@@ -23,6 +23,7 @@ degenerate-triangle removal, then outward-winding validation by signed volume.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -212,37 +213,78 @@ def _read_msh22_ascii(
     ``meshio.read`` for this format, so the two paths are interchangeable.
     """
     with path.open("r", encoding="utf-8", errors="replace") as handle:
-        lines = handle.read().splitlines()
+        text = handle.read()
 
-    fmt_at = _section_index(lines, "$MeshFormat")
-    version = lines[fmt_at + 1].split()[0] if fmt_at is not None else "?"
+    fmt_body = _section_body(text, "MeshFormat")
+    version = fmt_body.split(None, 1)[0] if fmt_body and fmt_body.strip() else "?"
     if not version.startswith("2."):
         raise MeshError(
             f"Built-in reader supports MSH 2.x ASCII only (file reports {version}). "
             "Install meshio to read this mesh."
         )
 
-    nodes_at = _section_index(lines, "$Nodes")
-    if nodes_at is None:
+    nodes_body = _section_body(text, "Nodes")
+    if nodes_body is None:
         raise MeshError("Mesh file has no $Nodes section")
-    n_nodes = int(lines[nodes_at + 1])
-    node_ids = np.empty(n_nodes, dtype=np.int64)
-    coords = np.empty((n_nodes, 3), dtype=np.float64)
-    for i in range(n_nodes):
-        parts = lines[nodes_at + 2 + i].split()
-        node_ids[i] = int(parts[0])
-        coords[i] = (float(parts[1]), float(parts[2]), float(parts[3]))
-
-    elems_at = _section_index(lines, "$Elements")
-    if elems_at is None:
+    # Node rows are exactly "id x y z".
+    tokens = nodes_body.split()
+    n_nodes = int(tokens[0])
+    if len(tokens) != 1 + 4 * n_nodes:
+        raise MeshError("Malformed $Nodes section")
+    node_table = np.array(tokens[1:], dtype=np.float64).reshape(n_nodes, 4)
+    node_ids = node_table[:, 0].astype(np.int64)
+    coords = np.ascontiguousarray(node_table[:, 1:])
+
+    elems_body = _section_body(text, "Elements")
+    if elems_body is None:
         raise MeshError("Mesh file has no $Elements section")
-    n_elems = int(lines[elems_at + 1])
+    raw, tri_tags = _msh22_triangles(elems_body)
+    if raw.shape[0] == 0:
+        raise MeshError("No triangles found in mesh")
+
+    # Map gmsh node ids (1-based, possibly sparse) onto zero-based indices.
+    order = np.argsort(node_ids, kind="stable")
+    sorted_ids = node_ids[order]
+    pos = np.searchsorted(sorted_ids, raw)
+    if np.any(pos >= sorted_ids.size) or np.any(sorted_ids[np.minimum(pos, sorted_ids.size - 1)] != raw):
+        raise MeshError("Mesh references node ids that are not defined")
+    tris = order[pos].astype(np.int32)
+
+    return coords, tris, tri_tags
+
+
+def _msh22_triangles(
+    elems_body: str,
+) -> tuple[NDArray[np.int64], NDArray[np.int32]]:
+    """Triangle node ids and physical tags from an MSH 2.2 ``$Elements`` body.
+
+    A block of triangles that all carry the same number of tags (what the
+    mesher writes) converts in one numpy call; anything else falls back to a
+    per-line walk.
+    """
+    count_line, _, rows = elems_body.lstrip().partition("\n")
+    n_elems = int(count_line)
+    tokens = rows.split()
+    if n_elems and len(tokens) % n_elems == 0:
+        table = np.array(tokens, dtype=np.int64).reshape(n_elems, -1)
+        n_tags = table.shape[1] - 6
+        # Row 0 starts aligned; a row that reads as a triangle with n_tags
+        # tags is exactly 6 + n_tags wide, so the next row is aligned as well.
+        if (
+            n_tags >= 0
+            and np.all(table[:, 1] == 2)  # gmsh element type 2 == 3-node triangle
+            and np.all(table[:, 2] == n_tags)
+        ):
+            if n_tags < 1:
+                raise MeshError("Mesh file has no triangle physical-group tags")
+            return table[:, 3 + n_tags:], table[:, 3].astype(np.int32)
 
     tri_nodes: list[tuple[int, int, int]] = []
     tri_tags: list[int] = []
+    lines = rows.splitlines()
     for i in range(n_elems):
-        parts = lines[elems_at + 2 + i].split()
-        if int(parts[1]) != 2:  # gmsh element type 2 == 3-node triangle
+        parts = lines[i].split()
+        if int(parts[1]) != 2:
             continue
         n_tags = int(parts[2])
         if n_tags < 1:
@@ -250,27 +292,25 @@ def _read_msh22_ascii(
         tri_tags.append(int(parts[3]))
         base = 3 + n_tags
         tri_nodes.append((int(parts[base]), int(parts[base + 1]), int(parts[base + 2])))
+    return (
+        np.asarray(tri_nodes, dtype=np.int64).reshape(-1, 3),
+        np.asarray(tri_tags, dtype=np.int32),
+    )
 
-    if not tri_nodes:
-        raise MeshError("No triangles found in mesh")
-
-    # Map gmsh node ids (1-based, possibly sparse) onto zero-based indices.
-    order = np.argsort(node_ids, kind="stable")
-    sorted_ids = node_ids[order]
-    raw = np.asarray(tri_nodes, dtype=np.int64)
-    pos = np.searchsorted(sorted_ids, raw)
-    if np.any(pos >= sorted_ids.size) or np.any(sorted_ids[np.minimum(pos, sorted_ids.size - 1)] != raw):
-        raise MeshError("Mesh references node ids that are not defined")
-    tris = order[pos].astype(np.int32)
 
-    return coords, tris, np.asarray(tri_tags, dtype=np.int32)
+_SECTION_HEADERS = {
+    name: re.compile(rf"^[ \t]*\${name}[ \t]*\r?\n", re.MULTILINE)
+    for name in ("MeshFormat", "Nodes", "Elements")
+}
 
 
-def _section_index(lines: list[str], header: str) -> int | None:
-    for i, line in enumerate(lines):
-        if line.strip() == header:
-            return i
-    return None
+def _section_body(text: str, name: str) -> str | None:
+    """Text between the ``$name`` header line and ``$Endname``, or None."""
+    match = _SECTION_HEADERS[name].search(text)
+    if match is None:
+        return None
+    end = text.find(f"$End{name}", match.end())
+    return text[match.end():end] if end >= 0 else text[match.end():]
 
 
 def _merge_duplicate_vertices(
@@ -286,6 +326,8 @@ def _merge_duplicate_vertices(
     if tol <= 0.0 or verts.shape[0] == 0:
         return verts, tris
 
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
     from scipy.spatial import cKDTree
 
     tree = cKDTree(verts)
@@ -293,20 +335,16 @@ def _merge_duplicate_vertices(
     if pairs.size == 0:
         return verts, tris
 
-    parent = np.arange(verts.shape[0], dtype=np.int64)
-
-    def find(i: int) -> int:
-        while parent[i] != i:
-            parent[i] = parent[parent[i]]
-            i = int(parent[i])
-        return int(i)
-
-    for a, b in pairs:
-        ra, rb = find(int(a)), find(int(b))
-        if ra != rb:
-            parent[max(ra, rb)] = min(ra, rb)
-
-    roots = np.array([find(i) for i in range(verts.shape[0])], dtype=np.int64)
+    # Weld groups are the connected components of the coincidence graph; each
+    # collapses onto its lowest vertex index.
+    n_verts = verts.shape[0]
+    graph = coo_matrix(
+        (np.ones(pairs.shape[0], dtype=np.int8), (pairs[:, 0], pairs[:, 1])),
+        shape=(n_verts, n_verts),
+    )
+    _, labels = connected_components(graph, directed=False)
+    _, lowest = np.unique(labels, return_index=True)
+    roots = lowest[labels]
     used, remap = np.unique(roots, return_inverse=True)
     return np.ascontiguousarray(verts[used]), np.ascontiguousarray(
         remap[tris].astype(np.int32)
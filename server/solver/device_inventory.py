@@ -411,6 +411,17 @@ def device_mode_readiness(device_mode: str) -> dict[str, Any]:
     probes ``hornlab_bempp_bem.device.configure_opencl`` for *that* type only.
     A working CPU device never makes ``opencl_gpu`` report ready. Never raises.
     """
+    return _device_mode_readiness(device_mode, None)
+
+
+def _device_mode_readiness(
+    device_mode: str, inventory: dict[str, Any] | None
+) -> dict[str, Any]:
+    """``device_mode_readiness`` against an optional pre-enumerated inventory.
+
+    Enumerating platforms and devices walks every installed ICD, so callers
+    probing several modes at once enumerate once and pass the snapshot in.
+    """
     normalized = _normalize_device_mode(device_mode)
     try:
         if normalized not in VALID_DEVICE_MODES:
@@ -434,7 +445,8 @@ def device_mode_readiness(device_mode: str) -> dict[str, Any]:
             "reason": "",
         }
 
-        inventory = opencl_device_inventory()
+        if inventory is None:
+            inventory = opencl_device_inventory()
         if not inventory.get("bindingAvailable"):
             result["reason"] = (
                 f"{inventory.get('bindingReason') or 'pyopencl is not importable.'} "
@@ -527,8 +539,9 @@ def acceleration_summary() -> dict[str, Any]:
     A CPU OpenCL device must never be reported as GPU acceleration. Never raises.
     """
     try:
-        cpu = device_mode_readiness("opencl_cpu")
-        gpu = device_mode_readiness("opencl_gpu")
+        inventory = opencl_device_inventory()
+        cpu = _device_mode_readiness("opencl_cpu", inventory)
+        gpu = _device_mode_readiness("opencl_gpu", inventory)
         numba = _numba_runtime()
 
         opencl_cpu = {
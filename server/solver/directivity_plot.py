@@ -7,6 +7,7 @@ produce stable, readable polar maps from per-frequency angle slices.
 
 import io
 import base64
+from functools import lru_cache
 import numpy as np
 
 import matplotlib
@@ -50,6 +51,7 @@ def render_directivity_plot(
     *,
     smooth=False,
     smoothing_fraction=FRACTIONAL_OCTAVE,
+    fig=None,
 ):
     """
     Render directivity heatmap(s) as a PNG image.
@@ -62,6 +64,8 @@ def render_directivity_plot(
         reference_level: Reference dB level for prominent contour (default -6)
         smooth: Apply fractional-octave smoothing after interpolation.
         smoothing_fraction: Fractional-octave denominator (default 24).
+        fig: Optional figure to clear and draw into instead of allocating a
+            new one. A caller-supplied figure is left open for reuse.
 
     Returns:
         Base64-encoded PNG string (without data URI prefix)
@@ -103,8 +107,9 @@ def render_directivity_plot(
         by_key["vertical"]["values_raw"],
     )
 
+    owns_figure = fig is None
     if symmetric:
-        fig, axes = plt.subplots(1, 1, figsize=(11, 5))
+        fig, axes = _figure_axes(fig, 1, 5)
         axes = [axes]
         titles = ["Directivity (H = V, Symmetric)"]
         datasets = [(
@@ -115,7 +120,7 @@ def render_directivity_plot(
     else:
         plane_count = len(planes)
         fig_height = 5 if plane_count == 1 else (4 * plane_count)
-        fig, axes = plt.subplots(plane_count, 1, figsize=(11, fig_height))
+        fig, axes = _figure_axes(fig, plane_count, fig_height)
         if not isinstance(axes, (list, np.ndarray)):
             axes = [axes]
         else:
@@ -123,33 +128,46 @@ def render_directivity_plot(
         titles = [_plane_title(entry["key"]) for entry in planes]
         datasets = [(entry["freqs"], entry["angles"], entry["values"]) for entry in planes]
 
-    fig.patch.set_facecolor(FIGURE_BG)
-    for ax, title, (plot_freqs, plot_angles, plot_values) in zip(axes, titles, datasets):
-        _render_single_heatmap(
-            ax,
-            plot_freqs,
-            plot_angles,
-            plot_values,
-            title,
-            reference_level=reference_level,
-        )
-
-    fig.tight_layout(pad=1.5)
-
     buf = io.BytesIO()
-    fig.savefig(
-        buf,
-        format="png",
-        dpi=dpi,
-        facecolor=fig.get_facecolor(),
-        edgecolor="none",
-        bbox_inches="tight",
-    )
-    plt.close(fig)
+    try:
+        fig.patch.set_facecolor(FIGURE_BG)
+        for ax, title, (plot_freqs, plot_angles, plot_values) in zip(axes, titles, datasets):
+            _render_single_heatmap(
+                ax,
+                plot_freqs,
+                plot_angles,
+                plot_values,
+                title,
+                reference_level=reference_level,
+            )
+
+        fig.tight_layout(pad=1.5)
+        fig.savefig(
+            buf,
+            format="png",
+            dpi=dpi,
+            facecolor=fig.get_facecolor(),
+            edgecolor="none",
+            bbox_inches="tight",
+        )
+    finally:
+        # pyplot keeps every open figure alive; release it even when a
+        # render fails so a long-running server does not accumulate canvases.
+        if owns_figure:
+            plt.close(fig)
     buf.seek(0)
     return base64.b64encode(buf.read()).decode("ascii")
 
 
+def _figure_axes(fig, nrows, height):
+    """Return ``(fig, axes)`` with ``nrows`` stacked axes on an 11-inch-wide figure."""
+    if fig is None:
+        return plt.subplots(nrows, 1, figsize=(11, height))
+    fig.clf()
+    fig.set_size_inches(11, height)
+    return fig, fig.subplots(nrows, 1)
+
+
 def _plane_title(key):
     if key == "horizontal":
         return "H Normalized Directivity"
@@ -164,6 +182,9 @@ def _build_grid(freqs, patterns):
     """
     Convert list of [[angle, dB], ...] per frequency into 2D arrays.
 
+    A pattern may also be an (N, 2) float array, which is read column-wise
+    instead of point by point.
+
     Returns:
         angles: 1D array of angle values
         freqs: 1D array of frequencies (with empty columns removed)
@@ -188,6 +209,11 @@ def _build_grid(freqs, patterns):
     values = np.full((angles.size, n_freqs), np.nan, dtype=float)
     for fi in range(n_freqs):
         pattern = patterns[fi]
+        if isinstance(pattern, np.ndarray):
+            if pattern.ndim == 2 and pattern.shape[1] >= 2:
+                column = np.asarray(pattern[: angles.size, 1], dtype=float)
+                values[: column.size, fi] = np.where(np.isfinite(column), column, np.nan)
+            continue
         if not isinstance(pattern, list):
             continue
         for ai, point in enumerate(pattern[: angles.size]):
@@ -205,6 +231,12 @@ def _build_grid(freqs, patterns):
 
 
 def _extract_angles(pattern):
+    if isinstance(pattern, np.ndarray):
+        if pattern.ndim != 2 or pattern.shape[1] < 2:
+            return None
+        column = np.asarray(pattern[:, 0], dtype=float)
+        column = column[np.isfinite(column)]
+        return column if column.size else None
     if not isinstance(pattern, list):
         return None
     out = []
@@ -497,6 +529,7 @@ def _log_grid_lines(freq_min, freq_max):
     return sorted(set(lines))
 
 
+@lru_cache(maxsize=64)
 def _preferred_frequency_ticks(freq_min, freq_max):
     """
     Build denser frequency ticks for directivity charts.
@@ -504,9 +537,12 @@ def _preferred_frequency_ticks(freq_min, freq_max):
     Requested density:
     - every 100 Hz between 100 and 1000
     - every 1 kHz between 1 kHz and 10 kHz
+
+    Cached per (min, max) because every panel of a figure asks for the same
+    span; the result is a tuple so callers cannot mutate the shared value.
     """
     if freq_max <= freq_min:
-        return []
+        return ()
 
     ticks = []
     ticks.extend(_linear_tick_range(freq_min, freq_max, 100.0, 1000.0, 100.0))
@@ -519,9 +555,9 @@ def _preferred_frequency_ticks(freq_min, freq_max):
         ticks.extend(_log_grid_lines(max(freq_min, 10000.0), freq_max))
 
     if not ticks:
-        return _log_grid_lines(freq_min, freq_max)
+        return tuple(_log_grid_lines(freq_min, freq_max))
 
-    return sorted({round(float(tick), 6) for tick in ticks})
+    return tuple(sorted({round(float(tick), 6) for tick in ticks}))
 
 
 def _linear_tick_range(freq_min, freq_max, domain_min, domain_max, step):
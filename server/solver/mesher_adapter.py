@@ -467,10 +467,9 @@ def _metadata_dict(value: Any) -> dict[str, Any]:
 
 def _tag_counts_from_tags(tags: np.ndarray) -> dict[str, int]:
     counts = {str(tag): 0 for tag in (1, 2, 3, 4)}
-    for raw_tag in np.asarray(tags, dtype=np.int32).tolist():
-        tag = int(raw_tag)
-        key = str(tag)
-        counts[key] = counts.get(key, 0) + 1
+    unique_tags, tag_totals = np.unique(np.asarray(tags, dtype=np.int32), return_counts=True)
+    for tag, total in zip(unique_tags.tolist(), tag_totals.tolist()):
+        counts[str(tag)] = total
     return counts
 
 
@@ -494,10 +493,12 @@ def _canonical_mesh_from_msh(path: Path, metadata: Mapping[str, Any] | None = No
     }
     canonical_metadata.update(mesher_metadata)
     canonical_metadata["mesherMetadata"] = mesher_metadata
+    # _triangles_and_tags already yields integer arrays and tolist() emits
+    # Python ints from any integer dtype, so no astype() copy is needed.
     return {
         "vertices": vertices.reshape(-1).tolist(),
-        "indices": triangles.reshape(-1).astype(int).tolist(),
-        "surfaceTags": tags.astype(int).tolist(),
+        "indices": triangles.reshape(-1).tolist(),
+        "surfaceTags": tags.tolist(),
         "metadata": canonical_metadata,
     }
 
@@ -0,0 +1,37 @@
+"""Shared event loop for test classes that drive async handlers and runners.
+
+Not a test module itself; import it as ``tests.loop_fixtures`` so it resolves
+under both ``unittest discover -s tests`` and ``unittest tests.<module>``.
+"""
+
+import asyncio
+import unittest
+
+
+class SharedLoopTestCase(unittest.TestCase):
+    """Run every coroutine of a test class on one event loop via ``_run``.
+
+    Like ``asyncio.run``, ``_run`` cancels whatever tasks the coroutine left
+    behind before returning, so nothing leaks into the next call or test.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.loop = asyncio.new_event_loop()
+        cls.addClassCleanup(cls.loop.close)
+        cls.addClassCleanup(
+            lambda: cls.loop.run_until_complete(cls.loop.shutdown_default_executor())
+        )
+
+    def _run(self, coro):
+        try:
+            return self.loop.run_until_complete(coro)
+        finally:
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
@@ -0,0 +1,15 @@
+"""Shared mesh-topology helpers for the mesher and solver integration suites.
+
+Not a test module itself; import it as ``tests.mesh_fixtures`` so it resolves
+under both ``unittest discover -s tests`` and ``unittest tests.<module>``.
+"""
+
+import numpy as np
+
+
+def open_boundary_edges(triangles: np.ndarray) -> np.ndarray:
+    """Edges used by exactly one triangle, as sorted ``(a, b)`` vertex pairs."""
+    tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    edges = np.sort(tris[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    keys, counts = np.unique(edges, axis=0, return_counts=True)
+    return keys[counts == 1]
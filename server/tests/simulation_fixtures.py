@@ -0,0 +1,128 @@
+"""Shared fixtures for the simulation route and runner test suites.
+
+Not a test module itself; import it as ``tests.simulation_fixtures`` so it
+resolves under both ``unittest discover -s tests`` and ``unittest tests.<module>``.
+"""
+
+from contextlib import contextmanager
+from types import MappingProxyType
+from unittest.mock import patch
+
+from contracts import MeshData, SimulationRequest
+import services.job_runtime as _jrt
+import services.simulation_runner as _sim_runner
+
+# Single-triangle source mesh shared by every MeshData fixture. Tuples keep the
+# shared literals immutable; Pydantic copies them into fresh lists on validation.
+VERTS = (0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+IDX = (0, 1, 2)
+TAGS = (2,)
+
+BASE_MESH_PAYLOAD = {
+    "vertices": VERTS,
+    "indices": IDX,
+    "surfaceTags": TAGS,
+    "format": "msh",
+    "boundaryConditions": {},
+    "metadata": {},
+}
+
+# Validated once and shared by contract-level tests. Pydantic does not
+# revalidate model instances, so passing it as ``mesh=`` only validates the
+# request fields under test; nothing in those tests mutates the mesh.
+BASE_MESH = MeshData(**BASE_MESH_PAYLOAD)
+
+MSH_TEXT = "$MeshFormat\n2.2 0 8\n$EndMeshFormat\n"
+MSH_BYTES = MSH_TEXT.encode("utf-8")
+
+
+def single_triangle_mesher_result():
+    """Return a fresh single-triangle mesher result; callers may mutate it."""
+    return {
+        "msh_text": MSH_TEXT,
+        "stats": {"nodeCount": 3, "elementCount": 1},
+        "canonical_mesh": {
+            "vertices": list(VERTS),
+            "indices": list(IDX),
+            "surfaceTags": list(TAGS),
+            "metadata": {},
+        },
+    }
+
+
+def construct_valid_request(**overrides):
+    """Build a request from trusted, already-canonical test data without validation.
+
+    Only for runner tests whose assertions sit downstream of validation;
+    ``model_construct`` skips field validators and normalisation entirely.
+    """
+    fields = {
+        "mesh": BASE_MESH.model_copy(deep=True),
+        "frequency_range": [100.0, 1000.0],
+        "num_frequencies": 10,
+        "sim_type": "2",
+        "options": {},
+        **overrides,
+    }
+    return SimulationRequest.model_construct(**fields)
+
+
+def _reset_job_runtime_state():
+    _jrt.jobs.clear()
+    _jrt.job_queue.clear()
+    _jrt.running_jobs.clear()
+    _jrt.scheduler_loop_running = False
+
+
+def isolate_job_runtime(test_case):
+    """Give one test empty in-memory job state, and empty it again afterwards.
+
+    The containers are cleared in place, never replaced: the runner imports
+    ``running_jobs`` by name, so a fresh object would split the state in two.
+    """
+    _reset_job_runtime_state()
+    test_case.addCleanup(_reset_job_runtime_state)
+
+
+@contextmanager
+def job_slot(job_id, **fields):
+    """Register an in-memory job entry for the duration of the block."""
+    _jrt.jobs[job_id] = {
+        "status": "queued", "progress": 0.0, "stage": "queued",
+        "stage_message": "", "results": None, "error": None,
+        **fields,
+    }
+    try:
+        yield _jrt.jobs[job_id]
+    finally:
+        _jrt.jobs.pop(job_id, None)
+
+
+# In-memory entry for a job the runner has already picked up.
+RUNNING_JOB_ENTRY = MappingProxyType({
+    "status": "running",
+    "progress": 0.5,
+    "stage": "running",
+    "stage_message": "running",
+    "results": None,
+    "error": None,
+    "error_message": None,
+    "has_results": False,
+    "has_mesh_artifact": False,
+    "cancellation_requested": False,
+})
+
+
+def running_job_entry(job_id, **fields):
+    return {**RUNNING_JOB_ENTRY, "id": job_id, **fields}
+
+
+def enable_hornlab_mesher_runtime(test_case):
+    """Patch the runner's HornLab mesher readiness flags on for one test."""
+    patcher = patch.multiple(
+        _sim_runner,
+        HORNLAB_MESHER_AVAILABLE=True,
+        HORNLAB_MESHER_RUNTIME_READY=True,
+    )
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
@@ -0,0 +1,38 @@
+"""Shared fakes for the bempp and metal solver adapter test suites.
+
+Not a test module itself; import it as ``tests.solver_adapter_fixtures`` so it
+resolves under both ``unittest discover -s tests`` and ``unittest tests.<module>``.
+"""
+
+import numpy as np
+
+
+def readonly_array(values, dtype):
+    """Build a fixture array once; read-only so a stray in-place write fails loudly."""
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+class FakeObservationConfig:
+    def __init__(
+        self,
+        *,
+        planes,
+        distance_m,
+        angle_min_deg,
+        angle_max_deg,
+        angle_count,
+        origin,
+    ):
+        self.planes = planes
+        self.distance_m = distance_m
+        self.angle_min_deg = angle_min_deg
+        self.angle_max_deg = angle_max_deg
+        self.angle_count = angle_count
+        self.origin = origin
+
+
+class FakeSolveConfig:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
@@ -5,7 +5,7 @@ from types import SimpleNamespace
 import numpy as np
 
 from contracts import PolarConfig, SimulationRequest
-from solver.result_mapping import build_solver_response, observation_config
+from solver.result_mapping import build_solver_response, observation_config, response_solver_log
 
 
 class _FakeObservationConfig:
@@ -171,8 +171,6 @@ if __name__ == "__main__":
 
 class ResponseSolverLogTest(unittest.TestCase):
     def test_strips_raw_sphere_pressure_only(self):
-        from solver.result_mapping import response_solver_log
-
         entries = [
             {"frequency_hz": 100.0, "observation_sphere_pressure_complex": np.ones(4)},
             {"frequency_hz": 200.0},
@@ -188,7 +186,5 @@ class ResponseSolverLogTest(unittest.TestCase):
         self.assertIn("observation_sphere_pressure_complex", entries[0])
 
     def test_empty_and_none_logs(self):
-        from solver.result_mapping import response_solver_log
-
         self.assertEqual(response_solver_log(None), [])
         self.assertEqual(response_solver_log([]), [])
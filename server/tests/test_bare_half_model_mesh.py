@@ -21,6 +21,7 @@ except Exception:  # pragma: no cover - adapter import guarded below
     build_waveguide_mesh = None
 
 from contracts import WaveguideParamsRequest
+from tests.mesh_fixtures import open_boundary_edges
 
 _BARE_HALF = {
     "formula_type": "OSSE",
@@ -56,14 +57,6 @@ def _mesher_runtime_ready() -> bool:
     return bool(HORNLAB_MESHER_AVAILABLE and HORNLAB_MESHER_RUNTIME_READY)
 
 
-def _open_boundary_edges(triangles: np.ndarray) -> np.ndarray:
-    counts: dict[tuple[int, int], int] = {}
-    for tri in triangles:
-        for a, b in ((tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])):
-            counts[(min(a, b), max(a, b))] = counts.get((min(a, b), max(a, b)), 0) + 1
-    return np.array([edge for edge, c in counts.items() if c == 1], dtype=np.int64)
-
-
 @unittest.skipUnless(_mesher_runtime_ready(), "hornlab-waveguide-mesher runtime not available")
 class BareHalfModelMeshTest(unittest.TestCase):
     def _build(self, quadrants: str):
@@ -94,7 +87,7 @@ class BareHalfModelMeshTest(unittest.TestCase):
 
                 # The mirror cut itself must exist: some open edges on the
                 # cut plane...
-                edges = _open_boundary_edges(tris)
+                edges = open_boundary_edges(tris)
                 self.assertGreater(len(edges), 0)
                 on_plane = np.all(np.abs(verts[edges][:, :, axis]) <= tol, axis=1)
                 self.assertGreater(
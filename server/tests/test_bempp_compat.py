@@ -33,6 +33,14 @@ def _reset_state():
 
 
 class QuoteIncludePathTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The package scaffolding never changes between tests; only the
+        # kernels module (which the workaround mutates) is rebuilt per test.
+        cls._core_module = types.ModuleType("bempp_cl.core")
+        cls._root_module = types.ModuleType("bempp_cl")
+        cls._root_module.core = cls._core_module
+
     def setUp(self):
         _reset_state()
         self.addCleanup(_reset_state)
@@ -40,13 +48,10 @@ class QuoteIncludePathTest(unittest.TestCase):
     def _with_fake_bempp(self, include_path):
         """Install a fake bempp_cl.core.opencl_kernels for the duration."""
         kernels = _FakeKernels(include_path)
-        core = types.ModuleType("bempp_cl.core")
-        core.opencl_kernels = kernels
-        root = types.ModuleType("bempp_cl")
-        root.core = core
+        self._core_module.opencl_kernels = kernels
         modules = {
-            "bempp_cl": root,
-            "bempp_cl.core": core,
+            "bempp_cl": self._root_module,
+            "bempp_cl.core": self._core_module,
             "bempp_cl.core.opencl_kernels": kernels,
         }
         patcher = patch.dict(sys.modules, modules)
@@ -1,5 +1,4 @@
 import json
-import math
 import tempfile
 import unittest
 from types import SimpleNamespace
@@ -10,30 +9,33 @@ import numpy as np
 from contracts import MeshData, PolarConfig, SimulationRequest
 from solver import bempp_solver
 from solver.result_mapping import REFERENCE_RHO_C
-
-
-class FakeObservationConfig:
-    def __init__(
-        self,
-        *,
-        planes,
-        distance_m,
-        angle_min_deg,
-        angle_max_deg,
-        angle_count,
-        origin,
-    ):
-        self.planes = planes
-        self.distance_m = distance_m
-        self.angle_min_deg = angle_min_deg
-        self.angle_max_deg = angle_max_deg
-        self.angle_count = angle_count
-        self.origin = origin
-
-
-class FakeSolveConfig:
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
+from tests.solver_adapter_fixtures import (
+    FakeObservationConfig,
+    FakeSolveConfig,
+    readonly_array,
+)
+
+# Fake solver output, built once at import and shared by every test.
+_RESULT_FREQUENCIES_HZ = readonly_array([500.0, 1000.0, 2000.0], float)
+_RESULT_ANGLES_DEG = readonly_array([-45.0, 0.0, 45.0], float)
+_RESULT_PRESSURE = readonly_array(
+    [
+        [[1.0e-5 + 0j, 2.0e-5 + 0j, 1.0e-5 + 0j]],
+        [[1.0e-4 + 0j, 2.0e-4 + 0j, 1.0e-4 + 0j]],
+        [[1.0e-3 + 0j, 2.0e-3 + 0j, 1.0e-3 + 0j]],
+    ],
+    np.complex128,
+)
+_RESULT_DIRECTIVITY_DB = readonly_array(
+    [
+        [[-6.0, 0.0, -6.0]],
+        [[-6.0, 0.0, -6.0]],
+        [[-6.0, 0.0, -6.0]],
+    ],
+    float,
+)
+# raw <p> under the corrected acceleration mapping (v = a/(-i*omega))
+_RESULT_RAW_IMPEDANCE = readonly_array([-1.0 + 0.5j, -2.0 + 1.5j, -3.0 + 2.5j], np.complex128)
 
 
 class BemppSolverAdapterTest(unittest.TestCase):
@@ -68,27 +70,12 @@ class BemppSolverAdapterTest(unittest.TestCase):
 
     def _fake_result(self):
         return SimpleNamespace(
-            frequencies_hz=np.array([500.0, 1000.0, 2000.0], dtype=float),
-            observation_angles_deg=np.array([-45.0, 0.0, 45.0], dtype=float),
+            frequencies_hz=_RESULT_FREQUENCIES_HZ,
+            observation_angles_deg=_RESULT_ANGLES_DEG,
             observation_planes=["horizontal"],
-            pressure_complex=np.array(
-                [
-                    [[1.0e-5 + 0j, 2.0e-5 + 0j, 1.0e-5 + 0j]],
-                    [[1.0e-4 + 0j, 2.0e-4 + 0j, 1.0e-4 + 0j]],
-                    [[1.0e-3 + 0j, 2.0e-3 + 0j, 1.0e-3 + 0j]],
-                ],
-                dtype=np.complex128,
-            ),
-            directivity_db=np.array(
-                [
-                    [[-6.0, 0.0, -6.0]],
-                    [[-6.0, 0.0, -6.0]],
-                    [[-6.0, 0.0, -6.0]],
-                ],
-                dtype=float,
-            ),
-            # raw <p> under the corrected acceleration mapping (v = a/(-i*omega))
-            impedance=np.array([-1.0 + 0.5j, -2.0 + 1.5j, -3.0 + 2.5j], dtype=np.complex128),
+            pressure_complex=_RESULT_PRESSURE,
+            directivity_db=_RESULT_DIRECTIVITY_DB,
+            impedance=_RESULT_RAW_IMPEDANCE,
             timings={"total_s": 0.2},
             solver_log=[
                 {"frequency_hz": np.float64(500.0), "impedance": 1.0 + 0.5j},
@@ -151,7 +138,7 @@ class BemppSolverAdapterTest(unittest.TestCase):
         self.assertTrue(all(value > 0.0 for value in result["impedance"]["real"]))
         self.assertEqual(result["spl_on_axis"]["phase_degrees"], [0.0, 0.0, 0.0])
         self.assertIn("horizontal", result["di"]["di"])
-        self.assertTrue(all(math.isfinite(value) for value in result["di"]["di"]["horizontal"]))
+        self.assertTrue(np.isfinite(result["di"]["di"]["horizontal"]).all())
         json.dumps(result)
 
         config = seen_configs[0]
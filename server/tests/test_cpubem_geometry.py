@@ -0,0 +1,214 @@
+"""Unit tests for the cpubem mesh loaders that do not need the reference horn."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from solver.cpubem.geometry import (
+    MeshError,
+    _merge_duplicate_vertices,
+    _msh22_triangles,
+    _read_msh22_ascii,
+)
+
+_TETRA_MSH = """\
+$MeshFormat
+2.2 0 8
+$EndMeshFormat
+$Nodes
+4
+1 0 0 0
+2 1 0 0
+3 0 1 0
+4 0 0 1
+$EndNodes
+$Elements
+2
+1 2 2 7 1 1 2 3
+2 2 2 8 1 1 3 4
+$EndElements
+"""
+
+
+class Msh22ReaderTest(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+
+    def _write(self, text: str, newline: str = "\n") -> Path:
+        path = self.tmp / "mesh.msh"
+        path.write_bytes(text.replace("\n", newline).encode("utf-8"))
+        return path
+
+    def _assert_tetra(self, verts, tris, tags):
+        np.testing.assert_array_equal(
+            verts, [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+        )
+        np.testing.assert_array_equal(tris, [[0, 1, 2], [0, 2, 3]])
+        np.testing.assert_array_equal(tags, [7, 8])
+        self.assertEqual(verts.dtype, np.float64)
+        self.assertEqual(tris.dtype, np.int32)
+        self.assertEqual(tags.dtype, np.int32)
+
+    def test_reads_lf_file(self):
+        self._assert_tetra(*_read_msh22_ascii(self._write(_TETRA_MSH)))
+
+    def test_reads_crlf_file(self):
+        self._assert_tetra(*_read_msh22_ascii(self._write(_TETRA_MSH, "\r\n")))
+
+    def test_maps_sparse_node_ids_to_file_order(self):
+        path = self._write(
+            _TETRA_MSH.replace(
+                "1 0 0 0\n2 1 0 0\n3 0 1 0\n4 0 0 1\n",
+                "20 1 0 0\n10 0 0 0\n40 0 0 1\n35 0 1 0\n",
+            ).replace(
+                "1 2 2 7 1 1 2 3\n2 2 2 8 1 1 3 4\n",
+                "1 2 2 7 1 10 20 35\n2 2 2 8 1 10 35 40\n",
+            )
+        )
+
+        verts, tris, tags = _read_msh22_ascii(path)
+
+        np.testing.assert_array_equal(
+            verts, [[1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 1.0, 0.0]]
+        )
+        np.testing.assert_array_equal(tris, [[1, 0, 3], [1, 3, 2]])
+        np.testing.assert_array_equal(tags, [7, 8])
+
+    def test_rejects_undefined_node_ids(self):
+        path = self._write(_TETRA_MSH.replace("2 2 2 8 1 1 3 4", "2 2 2 8 1 1 3 9"))
+        with self.assertRaisesRegex(MeshError, "not defined"):
+            _read_msh22_ascii(path)
+
+    def test_rejects_missing_nodes_section(self):
+        text = _TETRA_MSH.replace(
+            "$Nodes\n4\n1 0 0 0\n2 1 0 0\n3 0 1 0\n4 0 0 1\n$EndNodes\n", ""
+        )
+        with self.assertRaisesRegex(MeshError, r"no \$Nodes section"):
+            _read_msh22_ascii(self._write(text))
+
+    def test_rejects_node_count_that_disagrees_with_rows(self):
+        path = self._write(_TETRA_MSH.replace("$Nodes\n4\n", "$Nodes\n5\n"))
+        with self.assertRaisesRegex(MeshError, r"Malformed \$Nodes section"):
+            _read_msh22_ascii(path)
+
+    def test_rejects_missing_mesh_format_section(self):
+        path = self._write(_TETRA_MSH.replace("$MeshFormat\n2.2 0 8\n$EndMeshFormat\n", ""))
+        with self.assertRaisesRegex(MeshError, r"MSH 2\.x ASCII only \(file reports \?\)"):
+            _read_msh22_ascii(path)
+
+    def test_rejects_msh4_files(self):
+        path = self._write(_TETRA_MSH.replace("2.2 0 8", "4.1 0 8"))
+        with self.assertRaisesRegex(MeshError, r"file reports 4\.1"):
+            _read_msh22_ascii(path)
+
+
+def _elements_body(*rows: str) -> str:
+    return f"\n{len(rows)}\n" + "".join(f"{row}\n" for row in rows)
+
+
+class Msh22TrianglesTest(unittest.TestCase):
+    def _assert_triangles(self, body, nodes, tags):
+        raw, tri_tags = _msh22_triangles(body)
+        np.testing.assert_array_equal(raw, np.asarray(nodes, dtype=np.int64).reshape(-1, 3))
+        np.testing.assert_array_equal(tri_tags, tags)
+        self.assertEqual(raw.dtype, np.int64)
+        self.assertEqual(tri_tags.dtype, np.int32)
+
+    def test_uniform_triangle_block(self):
+        self._assert_triangles(
+            _elements_body("1 2 2 7 1 1 2 3", "2 2 2 8 1 1 3 4", "3 2 2 7 2 2 3 4"),
+            [[1, 2, 3], [1, 3, 4], [2, 3, 4]],
+            [7, 8, 7],
+        )
+
+    def test_single_tag_triangles(self):
+        self._assert_triangles(
+            _elements_body("1 2 1 9 1 2 3", "2 2 1 9 2 3 4"),
+            [[1, 2, 3], [2, 3, 4]],
+            [9, 9],
+        )
+
+    def test_mixed_element_types_keep_only_triangles(self):
+        self._assert_triangles(
+            _elements_body("1 15 2 0 1 1", "2 1 2 0 1 1 2", "3 2 2 5 1 1 2 3", "4 2 2 6 1 2 3 4"),
+            [[1, 2, 3], [2, 3, 4]],
+            [5, 6],
+        )
+
+    def test_triangles_with_varying_tag_counts(self):
+        self._assert_triangles(
+            _elements_body("1 2 1 4 1 2 3", "2 2 3 5 1 0 2 3 4"),
+            [[1, 2, 3], [2, 3, 4]],
+            [4, 5],
+        )
+
+    def test_mixed_block_whose_token_count_divides_evenly(self):
+        # 8 + 6 tokens reshape into two 7-wide rows that are not elements.
+        self._assert_triangles(
+            _elements_body("1 2 2 3 1 1 2 3", "2 15 2 0 1 5"),
+            [[1, 2, 3]],
+            [3],
+        )
+
+    def test_block_without_triangles(self):
+        self._assert_triangles(
+            _elements_body("1 1 2 0 1 1 2", "2 1 2 0 1 2 3"),
+            [],
+            [],
+        )
+
+    def test_tagless_triangles_raise_on_uniform_block(self):
+        with self.assertRaisesRegex(MeshError, "no triangle physical-group tags"):
+            _msh22_triangles(_elements_body("1 2 0 1 2 3", "2 2 0 2 3 4"))
+
+    def test_tagless_triangles_raise_on_mixed_block(self):
+        with self.assertRaisesRegex(MeshError, "no triangle physical-group tags"):
+            _msh22_triangles(_elements_body("1 1 2 0 1 1 2", "2 2 0 1 2 3"))
+
+
+class MergeDuplicateVerticesTest(unittest.TestCase):
+    def test_chained_coincident_vertices_collapse_to_lowest_index(self):
+        verts = np.array(
+            [
+                [5.0, 5.0, 5.0],
+                [0.16, 0.0, 0.0],
+                [1.05, 0.0, 0.0],
+                [0.08, 0.0, 0.0],
+                [0.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+            ]
+        )
+        tris = np.array([[4, 5, 6], [3, 2, 0], [1, 5, 4]], dtype=np.int32)
+
+        # 1-3 and 3-4 are within tol but 1-4 is not: the chain still welds.
+        merged_verts, merged_tris = _merge_duplicate_vertices(verts, tris, 0.1)
+
+        np.testing.assert_array_equal(merged_verts, verts[[0, 1, 2, 6]])
+        np.testing.assert_array_equal(merged_tris, [[1, 2, 3], [1, 2, 0], [1, 2, 1]])
+        self.assertEqual(merged_tris.dtype, np.int32)
+
+    def test_non_positive_tolerance_returns_inputs_unchanged(self):
+        verts = np.zeros((3, 3))
+        tris = np.array([[0, 1, 2]], dtype=np.int32)
+        for tol in (0.0, -1.0):
+            merged_verts, merged_tris = _merge_duplicate_vertices(verts, tris, tol)
+            self.assertIs(merged_verts, verts)
+            self.assertIs(merged_tris, tris)
+
+    def test_mesh_without_coincident_pairs_is_returned_unchanged(self):
+        verts = np.eye(3)
+        tris = np.array([[0, 1, 2]], dtype=np.int32)
+        merged_verts, merged_tris = _merge_duplicate_vertices(verts, tris, 1e-9)
+        self.assertIs(merged_verts, verts)
+        self.assertIs(merged_tris, tris)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -291,7 +291,7 @@ class TestOperatorStructure(ReferenceMeshMixin):
         )
         # The median ratio pins sign/normalisation/orientation exactly; the
         # scatter is the mesh's O(h) faceting error.
-        self.assertLess(abs(median_signed + 1.0), 1e-4)
+        self.assertAlmostEqual(median_signed, -1.0, delta=1e-4)
         self.assertLess(median_abs, 1e-2)
 
     def test_diagonal_is_dominated_by_the_mass_term(self):
@@ -1,11 +1,10 @@
-import asyncio
 import importlib.util
 from importlib import metadata
 import sys
 import types
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 from fastapi import HTTPException
 
@@ -14,6 +13,7 @@ from api.routes_misc import health_check
 from api.routes_simulation import submit_simulation
 from contracts import MeshData, SimulationRequest, WaveguideParamsRequest
 from solver.deps import SUPPORTED_DEPENDENCY_MATRIX, get_dependency_status
+from tests.loop_fixtures import SharedLoopTestCase
 
 
 def _dependency_status(
@@ -78,7 +78,31 @@ def _dependency_status(
     }
 
 
-class DependencyRuntimeTest(unittest.TestCase):
+def _health_check_patches(
+    *,
+    dependency_status,
+    dependency_doctor,
+    metal_ready,
+    metal_status,
+    mesher_runtime_ready=True,
+):
+    """Patch the health route's dependency probes; BEMPP is always reported missing."""
+    return patch.multiple(
+        "api.routes_misc",
+        get_dependency_status=MagicMock(return_value=dependency_status),
+        collect_runtime_doctor_report=MagicMock(return_value=dependency_doctor),
+        is_metal_fast_solve_ready=MagicMock(return_value=metal_ready),
+        metal_backend_status=MagicMock(return_value=metal_status),
+        BEMPP_SOLVER_READY=False,
+        bempp_backend_status=MagicMock(
+            return_value={"available": False, "reason": "hornlab-bempp-bem is not installed."}
+        ),
+        HORNLAB_MESHER_AVAILABLE=True,
+        HORNLAB_MESHER_RUNTIME_READY=mesher_runtime_ready,
+    )
+
+
+class DependencyRuntimeTest(SharedLoopTestCase):
     def test_solver_bootstrap_requires_real_mesher_package_availability(self):
         module_path = Path(__file__).resolve().parents[1] / "solver_bootstrap.py"
         fake_solver = types.ModuleType("solver")
@@ -256,18 +280,13 @@ class DependencyRuntimeTest(unittest.TestCase):
             ],
         }
 
-        with patch("api.routes_misc.get_dependency_status", return_value=dependency_status), patch(
-            "api.routes_misc.collect_runtime_doctor_report", return_value=dependency_doctor
-        ), patch("api.routes_misc.is_metal_fast_solve_ready", return_value=False), patch(
-            "api.routes_misc.metal_backend_status",
-            return_value={"available": False, "reason": "hornlab-metal-bem is not installed."},
-        ), patch("api.routes_misc.BEMPP_SOLVER_READY", False), patch(
-            "api.routes_misc.bempp_backend_status",
-            return_value={"available": False, "reason": "hornlab-bempp-bem is not installed."},
-        ), patch("api.routes_misc.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_misc.HORNLAB_MESHER_RUNTIME_READY", True
+        with _health_check_patches(
+            dependency_status=dependency_status,
+            dependency_doctor=dependency_doctor,
+            metal_ready=False,
+            metal_status={"available": False, "reason": "hornlab-metal-bem is not installed."},
         ):
-            response = asyncio.run(health_check())
+            response = self._run(health_check())
 
         self.assertEqual(response["status"], "ok")
         self.assertEqual(response["solver"], "unavailable")
@@ -309,13 +328,15 @@ class DependencyRuntimeTest(unittest.TestCase):
         )
         request = WaveguideParamsRequest(formula_type="OSSE")
 
-        with patch("api.routes_mesh.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_mesh.build_waveguide_mesh", return_value={}
-        ), patch("api.routes_mesh.HORNLAB_MESHER_RUNTIME_READY", False), patch(
-            "api.routes_mesh.get_dependency_status", return_value=dependency_status
+        with patch.multiple(
+            "api.routes_mesh",
+            HORNLAB_MESHER_AVAILABLE=True,
+            HORNLAB_MESHER_RUNTIME_READY=False,
+            build_waveguide_mesh=MagicMock(return_value={}),
+            get_dependency_status=MagicMock(return_value=dependency_status),
         ):
             with self.assertRaises(HTTPException) as ctx:
-                asyncio.run(build_mesh_from_params(request))
+                self._run(build_mesh_from_params(request))
 
         self.assertEqual(ctx.exception.status_code, 503)
         detail = str(ctx.exception.detail)
@@ -328,15 +349,16 @@ class DependencyRuntimeTest(unittest.TestCase):
         freeform = WaveguideParamsRequest(formula_type="FREEFORM")
         osse = WaveguideParamsRequest(formula_type="OSSE")
 
-        with patch("api.routes_mesh.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_mesh.HORNLAB_MESHER_FREEFORM_SUPPORTED", False
-        ), patch(
-            "api.routes_mesh.build_viewport_geometry",
-            return_value={"formula": "OSSE", "grid": {}, "metadata": {}},
-        ) as viewport_builder:
+        viewport_builder = MagicMock(return_value={"formula": "OSSE", "grid": {}, "metadata": {}})
+        with patch.multiple(
+            "api.routes_mesh",
+            HORNLAB_MESHER_AVAILABLE=True,
+            HORNLAB_MESHER_FREEFORM_SUPPORTED=False,
+            build_viewport_geometry=viewport_builder,
+        ):
             with self.assertRaises(HTTPException) as viewport_error:
-                asyncio.run(build_viewport_geometry_from_params(freeform))
-            osse_result = asyncio.run(build_viewport_geometry_from_params(osse))
+                self._run(build_viewport_geometry_from_params(freeform))
+            osse_result = self._run(build_viewport_geometry_from_params(osse))
 
         self.assertEqual(viewport_error.exception.status_code, 503)
         self.assertIn("FREEFORM", str(viewport_error.exception.detail))
@@ -355,29 +377,29 @@ class DependencyRuntimeTest(unittest.TestCase):
                 }
             },
         )
-        with patch("api.routes_simulation.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_simulation.HORNLAB_MESHER_FREEFORM_SUPPORTED", False
+        with patch.multiple(
+            "api.routes_simulation",
+            HORNLAB_MESHER_AVAILABLE=True,
+            HORNLAB_MESHER_FREEFORM_SUPPORTED=False,
         ):
             with self.assertRaises(HTTPException) as solve_error:
-                asyncio.run(submit_simulation(solve))
+                self._run(submit_simulation(solve))
 
         self.assertEqual(solve_error.exception.status_code, 503)
         self.assertIn("FREEFORM", str(solve_error.exception.detail))
 
         osse_solve = solve.model_copy(deep=True)
         osse_solve.options["mesh"]["waveguide_params"] = {"formula_type": "OSSE"}
-        with patch("api.routes_simulation.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_simulation.HORNLAB_MESHER_FREEFORM_SUPPORTED", False
-        ), patch(
-            "api.routes_simulation.HORNLAB_MESHER_RUNTIME_READY", True
-        ), patch(
-            "api.routes_simulation.build_waveguide_mesh", MagicMock()
-        ), patch(
-            "api.routes_simulation.is_metal_fast_solve_ready", return_value=True
-        ), patch(
-            "api.routes_simulation.create_simulation_job", return_value="osse-job"
+        with patch.multiple(
+            "api.routes_simulation",
+            HORNLAB_MESHER_AVAILABLE=True,
+            HORNLAB_MESHER_FREEFORM_SUPPORTED=False,
+            HORNLAB_MESHER_RUNTIME_READY=True,
+            build_waveguide_mesh=MagicMock(),
+            is_metal_fast_solve_ready=MagicMock(return_value=True),
+            create_simulation_job=MagicMock(return_value="osse-job"),
         ):
-            osse_solve_result = asyncio.run(submit_simulation(osse_solve))
+            osse_solve_result = self._run(submit_simulation(osse_solve))
 
         self.assertEqual(osse_solve_result, {"job_id": "osse-job"})
 
@@ -401,17 +423,13 @@ class DependencyRuntimeTest(unittest.TestCase):
             "reason": None,
         }
 
-        with patch("api.routes_misc.get_dependency_status", return_value=dependency_status), patch(
-            "api.routes_misc.collect_runtime_doctor_report", return_value=dependency_doctor
-        ), patch("api.routes_misc.is_metal_fast_solve_ready", return_value=False), patch(
-            "api.routes_misc.metal_backend_status", return_value=metal_status
-        ), patch("api.routes_misc.BEMPP_SOLVER_READY", False), patch(
-            "api.routes_misc.bempp_backend_status",
-            return_value={"available": False, "reason": "hornlab-bempp-bem is not installed."},
-        ), patch("api.routes_misc.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_misc.HORNLAB_MESHER_RUNTIME_READY", True
+        with _health_check_patches(
+            dependency_status=dependency_status,
+            dependency_doctor=dependency_doctor,
+            metal_ready=False,
+            metal_status=metal_status,
         ):
-            response = asyncio.run(health_check())
+            response = self._run(health_check())
 
         self.assertFalse(response["solverReady"])
         self.assertEqual(response["solver"], "unavailable")
@@ -432,17 +450,13 @@ class DependencyRuntimeTest(unittest.TestCase):
             "reason": None,
         }
 
-        with patch("api.routes_misc.get_dependency_status", return_value=dependency_status), patch(
-            "api.routes_misc.collect_runtime_doctor_report", return_value=dependency_doctor
-        ), patch("api.routes_misc.is_metal_fast_solve_ready", return_value=True), patch(
-            "api.routes_misc.metal_backend_status", return_value=metal_status
-        ), patch("api.routes_misc.BEMPP_SOLVER_READY", False), patch(
-            "api.routes_misc.bempp_backend_status",
-            return_value={"available": False, "reason": "hornlab-bempp-bem is not installed."},
-        ), patch("api.routes_misc.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_misc.HORNLAB_MESHER_RUNTIME_READY", True
+        with _health_check_patches(
+            dependency_status=dependency_status,
+            dependency_doctor=dependency_doctor,
+            metal_ready=True,
+            metal_status=metal_status,
         ):
-            response = asyncio.run(health_check())
+            response = self._run(health_check())
 
         self.assertTrue(response["solverReady"])
         self.assertEqual(response["solver"], "metal-bem")
@@ -479,15 +493,18 @@ class DependencyRuntimeTest(unittest.TestCase):
             "reason": "hornlab-metal-bem is not installed.",
         }
 
-        with patch("api.routes_simulation.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_simulation.HORNLAB_MESHER_RUNTIME_READY", True
-        ), patch(
-            "api.routes_simulation.build_waveguide_mesh", MagicMock()
-        ), patch("api.routes_simulation.is_metal_fast_solve_ready", return_value=False), patch(
-            "api.routes_simulation.metal_backend_status", return_value=metal_status
-        ), patch("api.routes_simulation.create_simulation_job") as create_simulation_job:
+        with patch.multiple(
+            "api.routes_simulation",
+            HORNLAB_MESHER_AVAILABLE=True,
+            HORNLAB_MESHER_RUNTIME_READY=True,
+            build_waveguide_mesh=MagicMock(),
+            is_metal_fast_solve_ready=MagicMock(return_value=False),
+            metal_backend_status=MagicMock(return_value=metal_status),
+            create_simulation_job=DEFAULT,
+        ) as mocks:
+            create_simulation_job = mocks["create_simulation_job"]
             with self.assertRaises(HTTPException) as ctx:
-                asyncio.run(submit_simulation(request))
+                self._run(submit_simulation(request))
 
         self.assertEqual(ctx.exception.status_code, 503)
         detail = str(ctx.exception.detail)
@@ -525,23 +542,24 @@ class DependencyRuntimeTest(unittest.TestCase):
             "reason": None,
         }
 
-        with patch("api.routes_simulation.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_simulation.HORNLAB_MESHER_RUNTIME_READY", True
-        ), patch(
-            "api.routes_simulation.build_waveguide_mesh", MagicMock()
-        ), patch(
-            "api.routes_simulation.is_metal_fast_solve_ready", return_value=False
-        ), patch(
-            "api.routes_simulation.metal_backend_status", return_value=metal_status
-        ), patch(
-            "api.routes_simulation.metal_fast_solve_unavailable_reason",
-            return_value=(
-                "Metal BEM fastest solve requires the Swift native release helper. "
-                "build=debug path=/tmp/HornlabMetalBemNative; run: npm run build:metal-helper"
+        with patch.multiple(
+            "api.routes_simulation",
+            HORNLAB_MESHER_AVAILABLE=True,
+            HORNLAB_MESHER_RUNTIME_READY=True,
+            build_waveguide_mesh=MagicMock(),
+            is_metal_fast_solve_ready=MagicMock(return_value=False),
+            metal_backend_status=MagicMock(return_value=metal_status),
+            metal_fast_solve_unavailable_reason=MagicMock(
+                return_value=(
+                    "Metal BEM fastest solve requires the Swift native release helper. "
+                    "build=debug path=/tmp/HornlabMetalBemNative; run: npm run build:metal-helper"
+                )
             ),
-        ), patch("api.routes_simulation.create_simulation_job") as create_simulation_job:
+            create_simulation_job=DEFAULT,
+        ) as mocks:
+            create_simulation_job = mocks["create_simulation_job"]
             with self.assertRaises(HTTPException) as ctx:
-                asyncio.run(submit_simulation(request))
+                self._run(submit_simulation(request))
 
         self.assertEqual(ctx.exception.status_code, 503)
         detail = str(ctx.exception.detail)
@@ -571,23 +589,25 @@ class DependencyRuntimeTest(unittest.TestCase):
             }}},
         )
 
-        with patch("api.routes_simulation.resolve_solver_backend", return_value="metal"), patch(
-            "api.routes_simulation.HORNLAB_MESHER_AVAILABLE", True
-        ), patch(
-            "api.routes_simulation.HORNLAB_MESHER_RUNTIME_READY", True
-        ), patch(
-            "api.routes_simulation.build_waveguide_mesh", MagicMock()
-        ), patch("api.routes_simulation.is_metal_fast_solve_ready", return_value=False), patch(
-            "api.routes_simulation.BEMPP_SOLVER_READY", False
-        ), patch(
-            "api.routes_simulation.metal_backend_status",
-            return_value={"available": False, "reason": "metal missing"},
-        ), patch(
-            "api.routes_simulation.bempp_backend_status",
-            return_value={"available": False, "reason": "bempp missing"},
-        ), patch("api.routes_simulation.create_simulation_job") as create_simulation_job:
+        with patch.multiple(
+            "api.routes_simulation",
+            resolve_solver_backend=MagicMock(return_value="metal"),
+            HORNLAB_MESHER_AVAILABLE=True,
+            HORNLAB_MESHER_RUNTIME_READY=True,
+            build_waveguide_mesh=MagicMock(),
+            is_metal_fast_solve_ready=MagicMock(return_value=False),
+            BEMPP_SOLVER_READY=False,
+            metal_backend_status=MagicMock(
+                return_value={"available": False, "reason": "metal missing"}
+            ),
+            bempp_backend_status=MagicMock(
+                return_value={"available": False, "reason": "bempp missing"}
+            ),
+            create_simulation_job=DEFAULT,
+        ) as mocks:
+            create_simulation_job = mocks["create_simulation_job"]
             with self.assertRaises(HTTPException) as ctx:
-                asyncio.run(submit_simulation(request))
+                self._run(submit_simulation(request))
 
         self.assertEqual(ctx.exception.status_code, 503)
         detail = str(ctx.exception.detail)
@@ -623,9 +643,9 @@ class DependencyRuntimeTest(unittest.TestCase):
             }}},
         )
 
-        with patch("api.routes_misc.get_dependency_status", return_value=dependency_status), patch(
-            "api.routes_misc.collect_runtime_doctor_report",
-            return_value={
+        with _health_check_patches(
+            dependency_status=dependency_status,
+            dependency_doctor={
                 "schemaVersion": 1,
                 "components": [],
                 "summary": {
@@ -635,29 +655,27 @@ class DependencyRuntimeTest(unittest.TestCase):
                     "solveIssues": [],
                 },
             },
-        ), patch("api.routes_misc.is_metal_fast_solve_ready", return_value=True), patch(
-            "api.routes_misc.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True, "reason": None},
-        ), patch("api.routes_misc.BEMPP_SOLVER_READY", False), patch(
-            "api.routes_misc.bempp_backend_status",
-            return_value={"available": False, "reason": "hornlab-bempp-bem is not installed."},
-        ), patch(
-            "api.routes_misc.HORNLAB_MESHER_AVAILABLE", True
-        ), patch("api.routes_misc.HORNLAB_MESHER_RUNTIME_READY", False):
-            health = asyncio.run(health_check())
+            metal_ready=True,
+            metal_status={"available": True, "supportedPlatform": True, "reason": None},
+            mesher_runtime_ready=False,
+        ):
+            health = self._run(health_check())
 
         self.assertTrue(health["solverReady"])
         self.assertFalse(health["mesherReady"])
 
-        with patch("api.routes_simulation.HORNLAB_MESHER_AVAILABLE", True), patch(
-            "api.routes_simulation.HORNLAB_MESHER_RUNTIME_READY", False
-        ), patch(
-            "api.routes_simulation.build_waveguide_mesh", MagicMock()
-        ), patch("api.routes_simulation.get_dependency_status", return_value=dependency_status) as dependency_mock, patch(
-            "api.routes_simulation.create_simulation_job"
-        ) as create_simulation_job:
+        dependency_mock = MagicMock(return_value=dependency_status)
+        with patch.multiple(
+            "api.routes_simulation",
+            HORNLAB_MESHER_AVAILABLE=True,
+            HORNLAB_MESHER_RUNTIME_READY=False,
+            build_waveguide_mesh=MagicMock(),
+            get_dependency_status=dependency_mock,
+            create_simulation_job=DEFAULT,
+        ) as mocks:
+            create_simulation_job = mocks["create_simulation_job"]
             with self.assertRaises(HTTPException) as ctx:
-                asyncio.run(submit_simulation(request))
+                self._run(submit_simulation(request))
 
         self.assertEqual(ctx.exception.status_code, 503)
         self.assertIn("hornlab-waveguide-mesher dependency check failed", str(ctx.exception.detail))
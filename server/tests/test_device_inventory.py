@@ -1,6 +1,5 @@
-import contextlib
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from scripts import check_solver_engine
 from solver.device_inventory import (
@@ -104,17 +103,16 @@ def _patch_runtime(
     """
     numba = numba or {"available": True, "reason": "numba 0.61.0 is available."}
     kernel_build = kernel_build or {"ok": True, "reason": "OpenCL kernel compiled successfully."}
-    return (
-        patch(
-            f"{MODULE}._import_pyopencl",
-            return_value=(binding, None if binding is not None else binding_reason),
+    return patch.multiple(
+        MODULE,
+        _import_pyopencl=MagicMock(
+            return_value=(binding, None if binding is not None else binding_reason)
         ),
-        patch(
-            f"{MODULE}._load_configure_opencl",
-            return_value=(configure, None if configure is not None else configure_reason),
+        _load_configure_opencl=MagicMock(
+            return_value=(configure, None if configure is not None else configure_reason)
         ),
-        patch(f"{MODULE}._numba_runtime", return_value=numba),
-        patch(f"{MODULE}.opencl_kernel_build_probe", return_value=kernel_build),
+        _numba_runtime=MagicMock(return_value=numba),
+        opencl_kernel_build_probe=MagicMock(return_value=kernel_build),
     )
 
 
@@ -137,10 +135,7 @@ class _ConfigureOpenCLStub:
 
 class DeviceInventoryTest(unittest.TestCase):
     def _run(self, func, **kwargs):
-        patches = _patch_runtime(**kwargs)
-        with contextlib.ExitStack() as stack:
-            for p in patches:
-                stack.enter_context(p)
+        with _patch_runtime(**kwargs):
             return func()
 
     def test_initialized_device_with_unbuildable_kernel_is_not_ready(self):
@@ -234,6 +229,25 @@ class DeviceInventoryTest(unittest.TestCase):
         # configure_opencl("gpu") must never be attempted with no GPU device present.
         self.assertNotIn("gpu", configure.calls)
 
+    def test_acceleration_summary_enumerates_platforms_once(self):
+        binding = _FakePyOpenCL(
+            platforms=[_FakePlatform(devices=[_cpu_device(), _gpu_device()])]
+        )
+        configure = _ConfigureOpenCLStub(
+            names={"cpu": "Fake OpenCL CPU", "gpu": "Fake OpenCL GPU"}
+        )
+
+        with patch.object(
+            binding, "get_platforms", wraps=binding.get_platforms
+        ) as get_platforms:
+            summary = self._run(
+                acceleration_summary, binding=binding, configure=configure
+            )
+
+        self.assertTrue(summary["openclCpu"]["available"])
+        self.assertTrue(summary["openclGpu"]["available"])
+        self.assertEqual(get_platforms.call_count, 1)
+
     def test_cpu_device_fields_are_populated(self):
         binding = _FakePyOpenCL(platforms=[_FakePlatform(devices=[_cpu_device()])])
         inventory = self._run(opencl_device_inventory, binding=binding)
@@ -463,14 +477,12 @@ class SolverEngineReadinessTest(unittest.TestCase):
             "effectiveBackend": "numba",
             "acceleratedByGpu": False,
         }
-        with patch.object(check_solver_engine, "_probe", side_effect=probe), patch.object(
+        with patch.multiple(
             check_solver_engine,
-            "_metal_status",
-            return_value={"ready": False, "reason": "Metal unavailable."},
-        ), patch.object(
-            check_solver_engine, "_missing_windows_runtime_dlls", return_value=[]
-        ), patch.object(
-            check_solver_engine, "acceleration_summary", return_value=acceleration
+            _probe=MagicMock(side_effect=probe),
+            _metal_status=MagicMock(return_value={"ready": False, "reason": "Metal unavailable."}),
+            _missing_windows_runtime_dlls=MagicMock(return_value=[]),
+            acceleration_summary=MagicMock(return_value=acceleration),
         ):
             status = check_solver_engine.collect_status()
 
@@ -494,18 +506,14 @@ class SolverEngineReadinessTest(unittest.TestCase):
             "openclGpu": {"available": False},
             "numba": {"available": False},
         }
-        with patch.object(
-            check_solver_engine,
-            "_probe",
-            return_value={"importable": False, "error": "missing"},
-        ), patch.object(
+        with patch.multiple(
             check_solver_engine,
-            "_metal_status",
-            return_value={"ready": True, "reason": "Metal BEM backend is ready."},
-        ), patch.object(
-            check_solver_engine, "_missing_windows_runtime_dlls", return_value=[]
-        ), patch.object(
-            check_solver_engine, "acceleration_summary", return_value=unavailable
+            _probe=MagicMock(return_value={"importable": False, "error": "missing"}),
+            _metal_status=MagicMock(
+                return_value={"ready": True, "reason": "Metal BEM backend is ready."}
+            ),
+            _missing_windows_runtime_dlls=MagicMock(return_value=[]),
+            acceleration_summary=MagicMock(return_value=unavailable),
         ):
             status = check_solver_engine.collect_status()
 
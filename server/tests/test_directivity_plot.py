@@ -7,91 +7,142 @@ import numpy as np
 
 MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
 
+if MATPLOTLIB_AVAILABLE:
+    from solver.directivity_plot import (
+        _build_grid,
+        _preferred_frequency_ticks,
+        render_directivity_plot,
+    )
+
+# Whole-multiple ticks per decade across the default 100 Hz - 10 kHz span.
+_EXPECTED_DEFAULT_TICKS = (
+    100.0, 200.0, 300.0, 400.0, 500.0, 600.0, 700.0, 800.0, 900.0, 1000.0,
+    2000.0, 3000.0, 4000.0, 5000.0, 6000.0, 7000.0, 8000.0, 9000.0, 10000.0,
+)
+
 
 def _pattern(points):
-    return [[float(a), float(db)] for a, db in points]
+    return np.asarray(points, dtype=np.float64)
 
 
 @unittest.skipUnless(MATPLOTLIB_AVAILABLE, "matplotlib is not installed")
 class DirectivityPlotTest(unittest.TestCase):
-    def _frequencies(self):
-        return [100.0, 1000.0]
+    @classmethod
+    def setUpClass(cls):
+        import matplotlib.pyplot as plt
 
-    def _render(self, directivity):
-        from solver.directivity_plot import render_directivity_plot
-        return render_directivity_plot(self._frequencies(), directivity)
+        # Every render clears and redraws this one shared figure.
+        cls._figure = plt.figure()
+        cls.addClassCleanup(plt.close, cls._figure)
 
-    def _vertical_only(self):
-        return {
+        # Read-only fixtures: render_directivity_plot never mutates its input.
+        cls.VERTICAL_ONLY = {
             "horizontal": [],
             "vertical": [
-                _pattern([(0, 0), (90, -6), (180, -12)]),
-                _pattern([(0, 0), (90, -8), (180, -15)]),
+                [[0.0, 0.0], [90.0, -6.0], [180.0, -12.0]],
+                [[0.0, 0.0], [90.0, -8.0], [180.0, -15.0]],
             ],
             "diagonal": [],
         }
-
-    def _diagonal_only(self):
-        return {
+        cls.DIAGONAL_ONLY = {
             "horizontal": [],
             "vertical": [],
             "diagonal": [
-                _pattern([(0, 0), (90, -7), (180, -14)]),
-                _pattern([(0, 0), (90, -9), (180, -18)]),
+                [[0.0, 0.0], [90.0, -7.0], [180.0, -14.0]],
+                [[0.0, 0.0], [90.0, -9.0], [180.0, -18.0]],
             ],
         }
-
-    def _mixed(self):
-        return {
+        cls.MIXED = {
             "horizontal": [
-                _pattern([(0, 0), (90, -5), (180, -11)]),
-                _pattern([(0, 0), (90, -7), (180, -14)]),
+                [[0.0, 0.0], [90.0, -5.0], [180.0, -11.0]],
+                [[0.0, 0.0], [90.0, -7.0], [180.0, -14.0]],
             ],
             "vertical": [
-                _pattern([(0, 0), (90, -6), (180, -13)]),
-                _pattern([(0, 0), (90, -8), (180, -16)]),
+                [[0.0, 0.0], [90.0, -6.0], [180.0, -13.0]],
+                [[0.0, 0.0], [90.0, -8.0], [180.0, -16.0]],
             ],
             "diagonal": [
-                _pattern([(0, 0), (90, -7), (180, -15)]),
-                _pattern([(0, 0), (90, -9), (180, -17)]),
+                [[0.0, 0.0], [90.0, -7.0], [180.0, -15.0]],
+                [[0.0, 0.0], [90.0, -9.0], [180.0, -17.0]],
             ],
         }
 
+    def _frequencies(self):
+        return [100.0, 1000.0]
+
+    def _render(self, directivity):
+        return render_directivity_plot(self._frequencies(), directivity, fig=self._figure)
+
     def test_renders_vertical_only(self):
-        image = self._render(self._vertical_only())
+        image = self._render(self.VERTICAL_ONLY)
         self.assertIsInstance(image, str)
         self.assertGreater(len(image), 100)
 
     def test_renders_diagonal_only(self):
-        image = self._render(self._diagonal_only())
+        image = self._render(self.DIAGONAL_ONLY)
         self.assertIsInstance(image, str)
         self.assertGreater(len(image), 100)
 
     def test_renders_mixed_planes(self):
-        image = self._render(self._mixed())
+        image = self._render(self.MIXED)
         self.assertIsInstance(image, str)
         self.assertGreater(len(image), 100)
 
+    def test_failed_render_still_closes_its_figure(self):
+        import matplotlib.pyplot as plt
+        from solver import directivity_plot
+
+        open_before = set(plt.get_fignums())
+        with patch.object(
+            directivity_plot,
+            "_render_single_heatmap",
+            side_effect=RuntimeError("render failed"),
+        ):
+            with self.assertRaises(RuntimeError):
+                render_directivity_plot(self._frequencies(), self.VERTICAL_ONLY)
+
+        self.assertEqual(set(plt.get_fignums()), open_before)
+
+    def test_caller_supplied_figure_is_reused_and_left_open(self):
+        import matplotlib.pyplot as plt
+
+        self._render(self.MIXED)
+        mixed_axes = len(self._figure.axes)
+        self._render(self.VERTICAL_ONLY)
+        self._render(self.MIXED)
+
+        # Each render clears the figure, so nothing accumulates across calls.
+        self.assertEqual(len(self._figure.axes), mixed_axes)
+        self.assertTrue(plt.fignum_exists(self._figure.number))
+
+    def test_array_patterns_build_the_same_grid_as_point_lists(self):
+        freqs = np.array(self._frequencies())
+        patterns = self.MIXED["horizontal"]
+
+        expected = _build_grid(freqs, patterns)
+        actual = _build_grid(freqs, [_pattern(pattern) for pattern in patterns])
+
+        for actual_array, expected_array in zip(actual, expected):
+            np.testing.assert_array_equal(actual_array, expected_array)
+
 
 @unittest.skipUnless(MATPLOTLIB_AVAILABLE, "matplotlib is not installed")
 class DirectivityTickGenerationTest(unittest.TestCase):
     def test_preferred_frequency_ticks_default_directivity_span(self):
-        from solver.directivity_plot import _preferred_frequency_ticks
-
         ticks = _preferred_frequency_ticks(100.0, 10000.0)
-        expected = list(np.arange(100.0, 1000.0 + 0.1, 100.0)) + list(np.arange(2000.0, 10000.0 + 0.1, 1000.0))
-        self.assertEqual(ticks, expected)
+        self.assertEqual(ticks, _EXPECTED_DEFAULT_TICKS)
 
     def test_preferred_frequency_ticks_clips_to_visible_range(self):
-        from solver.directivity_plot import _preferred_frequency_ticks
-
         ticks = _preferred_frequency_ticks(350.0, 4500.0)
-        self.assertEqual(ticks, [400.0, 500.0, 600.0, 700.0, 800.0, 900.0, 1000.0, 2000.0, 3000.0, 4000.0])
+        self.assertEqual(ticks, (400.0, 500.0, 600.0, 700.0, 800.0, 900.0, 1000.0, 2000.0, 3000.0, 4000.0))
 
 
 @unittest.skipUnless(MATPLOTLIB_AVAILABLE, "matplotlib is not installed")
 class DirectivitySmoothingTest(unittest.TestCase):
-    def _smoothing_probe_data(self):
+    @classmethod
+    def setUpClass(cls):
+        from solver.directivity_plot import _prepare_heatmap_data
+
         angles = np.array([-60.0, 0.0, 60.0])
         freqs = np.geomspace(500.0, 20_000.0, 56)
         values = (
@@ -99,7 +150,17 @@ class DirectivitySmoothingTest(unittest.TestCase):
             + 3.0 * np.sin(np.linspace(0.0, 9.0, freqs.size))[None, :]
             - np.abs(angles[:, None]) / 20.0
         )
-        return angles, freqs, values
+        for array in (angles, freqs, values):
+            array.flags.writeable = False
+        cls.PROBE = (angles, freqs, values)
+        # Only the smoothing options vary between tests; fill + interpolate
+        # of the probe grid runs once and the tests compare against it.
+        cls.UNSMOOTHED = _prepare_heatmap_data(angles, freqs, values)
+        for array in cls.UNSMOOTHED:
+            array.flags.writeable = False
+
+    def _smoothing_probe_data(self):
+        return self.PROBE
 
     def test_default_matches_legacy_output_on_realistic_grid(self):
         from solver.directivity_plot import (
@@ -111,7 +172,6 @@ class DirectivitySmoothingTest(unittest.TestCase):
             _fill_missing_values,
             _fractional_octave_smooth,
             _interpolate_heatmap_grid,
-            _prepare_heatmap_data,
         )
 
         angles, freqs, values = self._smoothing_probe_data()
@@ -135,16 +195,14 @@ class DirectivitySmoothingTest(unittest.TestCase):
             np.clip(legacy_values, MIN_DB, MAX_DB),
         )
 
-        actual = _prepare_heatmap_data(angles, freqs, values)
-
-        for actual_array, legacy_array in zip(actual, legacy):
+        for actual_array, legacy_array in zip(self.UNSMOOTHED, legacy):
             np.testing.assert_array_equal(actual_array, legacy_array)
 
     def test_smoothing_option_changes_interpolated_data(self):
         from solver.directivity_plot import _prepare_heatmap_data
 
         angles, freqs, values = self._smoothing_probe_data()
-        default_values = _prepare_heatmap_data(angles, freqs, values)[2]
+        default_values = self.UNSMOOTHED[2]
         smoothed_values = _prepare_heatmap_data(
             angles,
             freqs,
@@ -165,11 +223,7 @@ class DirectivitySmoothingTest(unittest.TestCase):
         )
 
         angles, freqs, values = self._smoothing_probe_data()
-        interp_angles, interp_freqs, interp_values = _prepare_heatmap_data(
-            angles,
-            freqs,
-            values,
-        )
+        interp_angles, interp_freqs, interp_values = self.UNSMOOTHED
         default_fraction = _prepare_heatmap_data(
             angles,
             freqs,
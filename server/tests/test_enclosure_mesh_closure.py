@@ -25,6 +25,7 @@ except Exception:  # pragma: no cover - adapter import guarded below
     build_waveguide_mesh = None
 
 from contracts import WaveguideParamsRequest
+from tests.mesh_fixtures import open_boundary_edges
 
 # Full "Superduper small" quarter-symmetry enclosure parameters (the failing job).
 _SUPERDUPER_SMALL = {
@@ -45,14 +46,6 @@ _SUPERDUPER_SMALL = {
 }
 
 
-def _open_boundary_edges(triangles: np.ndarray) -> np.ndarray:
-    counts: dict[tuple[int, int], int] = {}
-    for tri in triangles:
-        for a, b in ((tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])):
-            counts[(min(a, b), max(a, b))] = counts.get((min(a, b), max(a, b)), 0) + 1
-    return np.array([edge for edge, c in counts.items() if c == 1], dtype=np.int64)
-
-
 def _mesher_runtime_ready() -> bool:
     if build_waveguide_mesh is None:
         return False
@@ -75,7 +68,7 @@ class ReducedEnclosureMeshClosureTest(unittest.TestCase):
         verts = np.asarray(canonical["vertices"], dtype=float).reshape(-1, 3)
         tris = np.asarray(canonical["indices"], dtype=np.int64).reshape(-1, 3)
 
-        edges = _open_boundary_edges(tris)
+        edges = open_boundary_edges(tris)
         self.assertGreater(len(edges), 0, "expected open edges on the symmetry cut planes")
 
         tol = 1e-6
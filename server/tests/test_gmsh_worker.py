@@ -24,6 +24,7 @@ import time
 import unittest
 import urllib.request
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import patch
 
 import uvicorn
@@ -35,11 +36,12 @@ import services.simulation_runner as _runner
 from api.routes_simulation import router as simulation_router
 from db import SimulationDB
 from services.gmsh_worker import GMSH_WORKER_THREAD_NAME, run_on_gmsh_worker
+from tests.simulation_fixtures import isolate_job_runtime
 
 # Known-good bare waveguide parameters (same values as the bare half-model
 # mesh test); the real-gmsh test builds them, the fake tests just carry them
-# through request validation.
-_WAVEGUIDE_PARAMS = {
+# through request validation. Shared read-only; copy before handing it on.
+_WAVEGUIDE_PARAMS = MappingProxyType({
     "formula_type": "OSSE",
     "L": "80",
     "r0": 12.7,
@@ -57,7 +59,7 @@ _WAVEGUIDE_PARAMS = {
     "wall_thickness": 0.0,
     "enc_depth": 0.0,
     "source_shape": 2,
-}
+})
 
 
 def _solve_request_dump() -> dict:
@@ -182,13 +184,7 @@ class _SolveJobHarnessTest(unittest.TestCase):
         self.tmp = tempfile.TemporaryDirectory()
         self.addCleanup(self.tmp.cleanup)
 
-        _jrt.jobs.clear()
-        _jrt.job_queue.clear()
-        _jrt.running_jobs.clear()
-        _jrt.scheduler_loop_running = False
-        self.addCleanup(_jrt.jobs.clear)
-        self.addCleanup(_jrt.job_queue.clear)
-        self.addCleanup(_jrt.running_jobs.clear)
+        isolate_job_runtime(self)
 
         test_db = SimulationDB(Path(self.tmp.name) / "simulations.db")
         self._start_patch(_jrt, "db", test_db)
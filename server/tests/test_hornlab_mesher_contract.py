@@ -0,0 +1,476 @@
+import unittest
+from types import MappingProxyType
+from unittest.mock import patch
+
+import services.job_runtime as _jrt
+import services.simulation_runner as _sim_runner
+import solver.axisymmetry as _axisym
+from tests.loop_fixtures import SharedLoopTestCase
+from tests.simulation_fixtures import (
+    MSH_TEXT,
+    construct_valid_request,
+    enable_hornlab_mesher_runtime,
+    job_slot,
+    single_triangle_mesher_result,
+)
+
+
+class HornLabMesherBemMeshContractTest(SharedLoopTestCase):
+    """HornLab mesher Metal BEM path must pass waveguide params through to build_waveguide_mesh unchanged.
+
+    The outer wall shell is part of the BEM mesh (tag 1 in the ABEC/ATH convention).
+    The queued request must preserve the selected symmetry-reduction domain, and
+    the canonical mesh tags must pass through to solver mesh preparation unchanged.
+    """
+
+    _WAVEGUIDE_PARAMS = MappingProxyType({
+        "formula_type": "R-OSSE",
+        "R": "140",
+        "a": "50",
+        "r0": 12.7,
+        "a0": 15.5,
+        "k": 0.6,
+        "r": 0.4,
+        "b": "0.2",
+        "m": 0.86,
+        "q": 3.5,
+        "n_angular": 20,
+        "n_length": 8,
+        "wall_thickness": 6.0,
+        "enc_depth": 0.0,
+        "throat_res": 5.0,
+        "mouth_res": 15.0,
+        "quadrants": 1234,
+    })
+
+    def setUp(self):
+        enable_hornlab_mesher_runtime(self)
+
+    def test_large_realized_mesh_adds_soft_performance_warning(self):
+        triangle_count = 4_501
+        stats = _sim_runner._build_mesh_stats(
+            [],
+            [0] * (triangle_count * 3),
+            source="hornlab_waveguide_mesher",
+            metadata={"meshDomainMultiplier": 4.0},
+        )
+
+        self.assertEqual(stats["full_domain_triangle_count"], 18_004)
+        self.assertEqual(stats["soft_warning_full_domain_triangle_limit"], 18_000)
+        self.assertEqual(len(stats["warnings"]), 1)
+        self.assertIn("may take significantly longer", stats["warnings"][0])
+
+    def _make_hornlab_mesher_request(self, extra_params=None):
+        wp = {**self._WAVEGUIDE_PARAMS, **(extra_params or {})}
+        return construct_valid_request(
+            num_frequencies=1,
+            solver_backend="metal",
+            # This contract is specifically the full-3D gmsh mesh build; pin it so
+            # 'auto' does not route this circular geometry to the CircSym path
+            # (which never calls build_waveguide_mesh).
+            solver_mode="full_3d",
+            options={"mesh": {"strategy": "hornlab_mesher", "waveguide_params": wp}},
+        )
+
+    def test_hornlab_mesher_preserves_wall_thickness_in_build_call(self):
+        """run_simulation must NOT zero wall_thickness for HornLab mesher BEM builds.
+
+        The outer wall shell (wall_thickness > 0) is part of the BEM mesh: it forms the
+        topologically connected rigid-wall boundary that encloses the horn cavity.
+        The runner must forward the queued request to `build_waveguide_mesh`
+        without repairing or zeroing wall shell geometry on the way through.
+        """
+        request = self._make_hornlab_mesher_request({"wall_thickness": 6.0, "enc_depth": 0.0})
+
+        captured_params = []
+
+        def fake_build(params, **kwargs):
+            captured_params.append(params.copy())
+            return single_triangle_mesher_result()
+
+        def fake_metal_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        job_id = "test-preserve-wall"
+        with job_slot(job_id):
+            with patch.object(
+                _sim_runner, "build_waveguide_mesh",
+                side_effect=fake_build,
+            ), patch.object(
+                _sim_runner, "solve_metal_from_msh",
+                side_effect=fake_metal_solve,
+            ), patch.object(
+                _sim_runner, "db"
+            ):
+                self._run(_sim_runner.run_simulation(job_id, request))
+
+            self.assertEqual(_jrt.jobs[job_id]["status"], "complete")
+
+        self.assertTrue(
+            len(captured_params) > 0,
+            "build_waveguide_mesh must be called during hornlab_mesher run_simulation.",
+        )
+        call_params = captured_params[0]
+        self.assertEqual(
+            call_params.get("wall_thickness"),
+            6.0,
+            "HornLab mesher BEM build must preserve wall_thickness (outer wall is part of BEM mesh).",
+        )
+
+    def test_hornlab_mesher_preserves_reduced_domain_quadrants_in_build_call(self):
+        """Metal solves accept symmetry-reduced domains; quadrants must pass through unchanged."""
+        request = self._make_hornlab_mesher_request({"quadrants": 14})
+
+        fake_mesher_result = {
+            "msh_text": MSH_TEXT,
+            "stats": {"nodeCount": 5, "elementCount": 4},
+            "canonical_mesh": {
+                "vertices": [0, 0, 0, 1, 0, 0, 0, 1, 0, 0.5, 0, 0.5, 0.5, 0.5, 0],
+                "indices": [0, 1, 2, 1, 2, 3, 2, 3, 4, 0, 2, 4],
+                "surfaceTags": [1, 1, 2, 1],
+                "metadata": {},
+            },
+        }
+
+        def fake_metal_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        job_id = "test-hornlab-quadrants-accepted"
+        with job_slot(job_id):
+            with patch.object(
+                _sim_runner, "build_waveguide_mesh",
+                return_value=fake_mesher_result,
+            ) as build_mesh, patch.object(
+                _sim_runner, "solve_metal_from_msh",
+                side_effect=fake_metal_solve,
+            ), patch.object(
+                _sim_runner, "db"
+            ):
+                self._run(_sim_runner.run_simulation(job_id, request))
+
+            build_mesh.assert_called_once()
+            forwarded_params = build_mesh.call_args.args[0]
+            self.assertEqual(forwarded_params.get("quadrants"), 14,
+                "Metal solve path must preserve the requested symmetry-reduction domain")
+            self.assertEqual(_jrt.jobs[job_id].get("status"), "complete",
+                "Reduced-domain quadrants must be accepted for the HornLab mesher path")
+
+    def test_hornlab_mesher_preserves_quadrants_for_bempp_build_call(self):
+        request = self._make_hornlab_mesher_request({"quadrants": 14})
+        request.solver_backend = "bempp"
+
+        fake_mesher_result = {
+            "msh_text": MSH_TEXT,
+            "stats": {"nodeCount": 5, "elementCount": 4},
+            "canonical_mesh": {
+                "vertices": [0, 0, 0, 1, 0, 0, 0, 1, 0, 0.5, 0, 0.5, 0.5, 0.5, 0],
+                "indices": [0, 1, 2, 1, 2, 3, 2, 3, 4, 0, 2, 4],
+                "surfaceTags": [1, 1, 2, 1],
+                "metadata": {},
+            },
+        }
+
+        def fake_bempp_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        job_id = "test-hornlab-bempp-quarter-domain"
+        with job_slot(job_id):
+            with patch.object(
+                _sim_runner, "build_waveguide_mesh",
+                return_value=fake_mesher_result,
+            ) as build_mesh, patch.object(
+                _sim_runner, "solve_bempp_from_msh",
+                side_effect=fake_bempp_solve,
+            ), patch.object(
+                _sim_runner, "db"
+            ):
+                self._run(_sim_runner.run_simulation(job_id, request))
+
+            build_mesh.assert_called_once()
+            forwarded_params = build_mesh.call_args.args[0]
+            self.assertEqual(forwarded_params.get("quadrants"), 14)
+            self.assertEqual(_jrt.jobs[job_id].get("status"), "complete")
+
+    def test_hornlab_mesher_preserves_canonical_surface_tags_for_solver_mesh(self):
+        request = self._make_hornlab_mesher_request()
+
+        fake_mesher_result = {
+            "msh_text": MSH_TEXT,
+            "stats": {"nodeCount": 5, "elementCount": 4},
+            "canonical_mesh": {
+                "vertices": [
+                    0.0, 0.0, 0.0,
+                    1.0, 0.0, 0.0,
+                    1.0, 1.0, 0.0,
+                    0.0, 1.0, 0.0,
+                    0.5, 0.5, 0.5,
+                ],
+                "indices": [
+                    0, 1, 4,
+                    1, 2, 4,
+                    2, 3, 4,
+                    3, 0, 4,
+                ],
+                "surfaceTags": [1, 2, 3, 4],
+                "metadata": {
+                    "identityTriangleCounts": {
+                        "inner_wall": 1,
+                        "outer_wall": 0,
+                        "mouth_rim": 0,
+                        "throat_return": 0,
+                        "rear_cap": 0,
+                        "horn_wall": 0,
+                        "throat_disc": 1,
+                        "enc_front": 0,
+                        "enc_side": 0,
+                        "enc_rear": 0,
+                        "enc_edge": 0,
+                    }
+                },
+            },
+        }
+
+        def fake_metal_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        job_id = "test-hornlab-canonical-tags"
+        with job_slot(job_id):
+            with patch.object(
+                _sim_runner, "build_waveguide_mesh", return_value=fake_mesher_result
+            ), patch.object(
+                _sim_runner, "solve_metal_from_msh",
+                side_effect=fake_metal_solve,
+            ):
+                self._run(_sim_runner.run_simulation(job_id, request))
+
+            # Canonical surface tags are now captured in mesh_stats (not passed to prepare_mesh).
+            mesh_stats = _jrt.jobs[job_id].get("mesh_stats", {})
+            self.assertEqual(mesh_stats.get("tag_counts"), {1: 1, 2: 1, 3: 1, 4: 1})
+            self.assertEqual(_jrt.jobs[job_id]["status"], "complete")
+
+    def test_hornlab_mesher_publishes_mesh_stats_after_canonical_mesh_build(self):
+        request = self._make_hornlab_mesher_request()
+
+        fake_mesher_result = {
+            "msh_text": MSH_TEXT,
+            "stats": {"nodeCount": 5, "elementCount": 4},
+            "canonical_mesh": {
+                "vertices": [
+                    0.0, 0.0, 0.0,
+                    1.0, 0.0, 0.0,
+                    1.0, 1.0, 0.0,
+                    0.0, 1.0, 0.0,
+                    0.5, 0.5, 0.5,
+                ],
+                "indices": [
+                    0, 1, 4,
+                    1, 2, 4,
+                    2, 3, 4,
+                    3, 0, 4,
+                ],
+                "surfaceTags": [1, 2, 3, 4],
+                "metadata": {
+                    "identityTriangleCounts": {
+                        "inner_wall": 1,
+                        "outer_wall": 0,
+                        "mouth_rim": 0,
+                        "throat_return": 0,
+                        "rear_cap": 0,
+                        "horn_wall": 0,
+                        "throat_disc": 1,
+                        "enc_front": 0,
+                        "enc_side": 0,
+                        "enc_rear": 0,
+                        "enc_edge": 0,
+                    }
+                },
+            },
+        }
+
+        def fake_metal_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        job_id = "test-hornlab-mesh-stats"
+        with job_slot(job_id):
+            with patch.object(
+                _sim_runner, "build_waveguide_mesh", return_value=fake_mesher_result
+            ), patch.object(
+                _sim_runner, "solve_metal_from_msh",
+                side_effect=fake_metal_solve,
+            ):
+                self._run(_sim_runner.run_simulation(job_id, request))
+
+            self.assertEqual(
+                _jrt.jobs[job_id].get("mesh_stats"),
+                {
+                    "vertex_count": 5,
+                    "triangle_count": 4,
+                    "source": "hornlab_waveguide_mesher",
+                    "bounds_m": {
+                        "min_x": 0.0,
+                        "min_y": 0.0,
+                        "min_z": 0.0,
+                        "max_x": 1.0,
+                        "max_y": 1.0,
+                        "max_z": 0.5,
+                    },
+                    "dimensions_m": {
+                        "width": 1.0,
+                        "height": 0.5,
+                        "depth": 1.0,
+                    },
+                    "tag_counts": {1: 1, 2: 1, 3: 1, 4: 1},
+                    "identity_triangle_counts": {
+                        "inner_wall": 1,
+                        "outer_wall": 0,
+                        "mouth_rim": 0,
+                        "throat_return": 0,
+                        "rear_cap": 0,
+                        "horn_wall": 0,
+                        "throat_disc": 1,
+                        "enc_front": 0,
+                        "enc_side": 0,
+                        "enc_rear": 0,
+                        "enc_edge": 0,
+                    },
+                    "domain_multiplier": 1.0,
+                    "full_domain_triangle_count": 4,
+                    "soft_warning_full_domain_triangle_limit": 18_000,
+                    "warnings": [],
+                },
+            )
+
+    def test_non_circular_infinite_baffle_routes_to_full_3d_with_aperture_metadata(self):
+        request = self._make_hornlab_mesher_request(
+            {
+                "formula_type": "OSSE",
+                "L": "120",
+                "R": None,
+                "sim_type": 1,
+                "enc_depth": 0.0,
+                "wall_thickness": 0.0,
+                "morph_target": 1,
+                "morph_width": 420.0,
+                "morph_height": 260.0,
+            }
+        ).model_copy(update={"sim_type": "1", "solver_mode": "auto"})
+
+        captured_build_params = []
+        captured_solve_requests = []
+        captured_solve_kwargs = []
+        fake_mesher_result = {
+            "msh_text": MSH_TEXT,
+            "metadata": {"apertureTag": 12},
+            "stats": {"nodeCount": 5, "elementCount": 3, "metadata": {"apertureTag": 12}},
+            "canonical_mesh": {
+                "vertices": [
+                    0.0, 0.0, 0.0,
+                    1.0, 0.0, 0.0,
+                    1.0, 1.0, 0.0,
+                    0.0, 1.0, 0.0,
+                    0.5, 0.5, 0.5,
+                ],
+                "indices": [
+                    0, 1, 4,
+                    1, 2, 4,
+                    2, 3, 4,
+                ],
+                "surfaceTags": [1, 2, 12],
+                "metadata": {"apertureTag": 12},
+            },
+        }
+
+        def fake_build(params, **_kwargs):
+            captured_build_params.append(params.copy())
+            return fake_mesher_result
+
+        def fake_metal_solve(_msh_path, solve_request, **kwargs):
+            captured_solve_requests.append(solve_request)
+            captured_solve_kwargs.append(kwargs)
+            return {"frequencies": [100.0], "directivity": {}, "metadata": {}}
+
+        job_id = "test-noncircular-ib-full-3d"
+        with job_slot(job_id):
+            with patch.object(
+                     _axisym, "_circsym_rejection_reasons_for_payload",
+                     return_value=["CircSym requires a circular waveguide: morphTarget is 1"],
+                 ), \
+                 patch.object(_sim_runner, "build_waveguide_mesh", side_effect=fake_build), \
+                 patch.object(_sim_runner, "solve_metal_from_msh", side_effect=fake_metal_solve), \
+                 patch.object(_sim_runner, "db"):
+                self._run(_sim_runner.run_simulation(job_id, request))
+
+            self.assertEqual(_jrt.jobs[job_id]["status"], "complete")
+            self.assertEqual(len(captured_build_params), 1)
+            forwarded = captured_build_params[0]
+            self.assertEqual(forwarded["sim_type"], 1)
+            self.assertEqual(forwarded["enc_depth"], 0.0)
+            self.assertEqual(captured_solve_requests[0].sim_type, "1")
+            self.assertEqual(captured_solve_kwargs[0]["mesh_metadata"], {"apertureTag": 12})
+            metadata = _jrt.jobs[job_id]["results"]["metadata"]
+            self.assertNotIn("infinite_baffle_approximation", metadata)
+            self.assertEqual(metadata["mesh_stats"]["tag_counts"], {1: 1, 2: 1, 3: 0, 4: 0, 12: 1})
+
+    def test_circular_infinite_baffle_still_uses_circsym_path(self):
+        request = self._make_hornlab_mesher_request(
+            {
+                "formula_type": "OSSE",
+                "L": "120",
+                "R": None,
+                "sim_type": 1,
+                "enc_depth": 0.0,
+                "wall_thickness": 0.0,
+                "morph_target": 0,
+            }
+        ).model_copy(update={"sim_type": "1", "solver_mode": "auto"})
+
+        def fail_if_meshed(*_args, **_kwargs):
+            raise AssertionError("circular infinite baffle must not build a full-3D mesh")
+
+        job_id = "test-circular-ib-circsym"
+        with job_slot(job_id):
+            with patch.object(
+                     _axisym, "_circsym_rejection_reasons_for_payload",
+                     return_value=[],
+                 ), \
+                 patch.object(_sim_runner, "build_waveguide_mesh", side_effect=fail_if_meshed), \
+                 patch.object(
+                     _sim_runner, "solve_circsym_from_params",
+                     return_value={"frequencies": [100.0], "directivity": {}, "metadata": {}},
+                 ) as circsym_solve, \
+                 patch.object(_sim_runner, "db"):
+                self._run(_sim_runner.run_simulation(job_id, request))
+
+            self.assertEqual(_jrt.jobs[job_id]["status"], "complete")
+            circsym_solve.assert_called_once()
+            self.assertEqual(circsym_solve.call_args.args[0]["sim_type"], 1)
+            self.assertNotIn(
+                "infinite_baffle_approximation",
+                _jrt.jobs[job_id]["results"]["metadata"],
+            )
+
+    def test_infinite_baffle_with_user_enclosure_depth_errors_before_fallback(self):
+        request = self._make_hornlab_mesher_request(
+            {"sim_type": 1, "enc_depth": 10.0, "wall_thickness": 0.0}
+        ).model_copy(update={"sim_type": "1", "solver_mode": "auto"})
+
+        job_id = "test-ib-enclosure-conflict"
+        with job_slot(job_id):
+            with patch.object(
+                     _axisym, "_circsym_rejection_reasons_for_payload",
+                 ) as rejection_probe, \
+                 patch.object(_sim_runner, "build_waveguide_mesh") as build_mesh, \
+                 patch.object(_sim_runner, "db"):
+                self._run(_sim_runner.run_simulation(job_id, request))
+
+            self.assertEqual(_jrt.jobs[job_id]["status"], "error")
+            self.assertEqual(
+                _jrt.jobs[job_id]["error_message"],
+                _sim_runner.INFINITE_BAFFLE_ENCLOSURE_ERROR,
+            )
+            rejection_probe.assert_not_called()
+            build_mesh.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+from api.routes_misc import render_directivity
+from api.routes_simulation import get_job_status, get_mesh_artifact, get_results
+from contracts import DirectivityRenderRequest
+import services.job_runtime as _jrt
+from tests.loop_fixtures import SharedLoopTestCase
+from tests.simulation_fixtures import MSH_BYTES, MSH_TEXT, job_slot
+
+
+class MeshArtifactEndpointTest(SharedLoopTestCase):
+    def test_mesh_artifact_returns_404_for_unknown_job(self):
+        with self.assertRaises(HTTPException) as ctx:
+            self._run(get_mesh_artifact("nonexistent-job"))
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_mesh_artifact_returns_404_when_no_artifact(self):
+        with job_slot("test-no-artifact", status="complete"):
+            with self.assertRaisesRegex(HTTPException, "No mesh artifact") as ctx:
+                self._run(get_mesh_artifact("test-no-artifact"))
+            self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_mesh_artifact_returns_msh_text(self):
+        with job_slot("test-with-artifact", status="complete", mesh_artifact=MSH_TEXT):
+            resp = self._run(get_mesh_artifact("test-with-artifact"))
+            self.assertEqual(resp.body, MSH_BYTES)
+            self.assertIn("text/plain", resp.media_type)
+
+
+class HttpSemanticsTest(SharedLoopTestCase):
+    """Verify that HTTP status codes follow the Gate A contract.
+
+    - missing result resource  -> 404
+    - validation failures       -> 422
+    - dependency unavailable    -> 503
+    - unexpected server error   -> 500
+    """
+
+    def test_get_results_missing_stored_results_returns_404(self):
+        """get_results must return 404 when the DB has no stored results for a complete job."""
+        job_id = "test-missing-stored-results"
+        _jrt.jobs[job_id] = {"status": "complete", "results": None}
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+        with patch.object(_jrt.db, "get_results", return_value=None):
+            with self.assertRaisesRegex(HTTPException, r"(?i)not available") as ctx:
+                self._run(get_results(job_id))
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_render_directivity_empty_input_returns_422(self):
+        """render_directivity must return 422 (not 400) for missing request data."""
+        request = DirectivityRenderRequest(frequencies=[], directivity={})
+        with self.assertRaises(HTTPException) as ctx:
+            self._run(render_directivity(request))
+        self.assertEqual(ctx.exception.status_code, 422)
+
+    def test_unknown_job_lookups_return_404(self):
+        """get_results and get_job_status must return 404 for a job ID that does not exist."""
+        async def lookups():
+            return await asyncio.gather(
+                get_results("nonexistent-job-id-xyz"),
+                get_job_status("nonexistent-job-id-xyz"),
+                return_exceptions=True,
+            )
+
+        outcomes = self._run(lookups())
+        for handler, outcome in zip(("get_results", "get_job_status"), outcomes):
+            with self.subTest(handler):
+                self.assertIsInstance(outcome, HTTPException)
+                self.assertEqual(outcome.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import tempfile
 import unittest
+from types import MappingProxyType
 
 import numpy as np
 
@@ -18,9 +19,11 @@ from solver.metal_solver import (
     solve_circsym_from_params,
     solve_metal_from_msh,
 )
+from tests.mesh_fixtures import open_boundary_edges
 
 
-_BASE_PAYLOAD = {
+# Read-only bases; _payload derives each variant with a single dict merge.
+_BASE_PAYLOAD = MappingProxyType({
     "formula_type": "OSSE",
     "L": 80.0,
     "r0": 12.7,
@@ -38,34 +41,25 @@ _BASE_PAYLOAD = {
     "rear_res": 10.0,
     "source_shape": 2,
     "source_velocity": 1,
-}
+})
 
-
-def _payload(*, sim_type: int, quadrants: int = 1234, morph: bool = False) -> dict:
-    out = dict(_BASE_PAYLOAD)
-    out["sim_type"] = sim_type
-    out["wall_thickness"] = 0.0 if sim_type == 1 else 6.0
-    out["quadrants"] = quadrants
-    if morph:
-        out.update(
-            {
-                "morph_target": 1,
-                "morph_width": 150.0,
-                "morph_height": 90.0,
-                "morph_corner": 12.0,
-                "morph_rate": 0.7,
-            }
-        )
-    return out
+_MORPH_OVERRIDES = MappingProxyType({
+    "morph_target": 1,
+    "morph_width": 150.0,
+    "morph_height": 90.0,
+    "morph_corner": 12.0,
+    "morph_rate": 0.7,
+})
 
 
-def _open_boundary_edges(triangles: np.ndarray) -> np.ndarray:
-    counts: dict[tuple[int, int], int] = {}
-    for tri in triangles:
-        for a, b in ((tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])):
-            key = (min(int(a), int(b)), max(int(a), int(b)))
-            counts[key] = counts.get(key, 0) + 1
-    return np.asarray([edge for edge, count in counts.items() if count == 1], dtype=np.int64)
+def _payload(*, sim_type: int, quadrants: int = 1234, morph: bool = False) -> dict:
+    return {
+        **_BASE_PAYLOAD,
+        "sim_type": sim_type,
+        "wall_thickness": 0.0 if sim_type == 1 else 6.0,
+        "quadrants": quadrants,
+        **(_MORPH_OVERRIDES if morph else {}),
+    }
 
 
 def _mesher_runtime_ready() -> bool:
@@ -122,8 +116,33 @@ def _request(payload: dict, *, solver_mode: str = "auto") -> SimulationRequest:
     )
 
 
-def _solve_full_3d(payload: dict) -> dict:
-    mesh_result = build_waveguide_mesh(payload, include_canonical=False)
+_MESH_CACHE: dict[tuple[int, int, bool], dict] = {}
+
+
+def _built_mesh(
+    sim_type: int,
+    quadrants: int = 1234,
+    morph: bool = False,
+    *,
+    include_canonical: bool = True,
+) -> dict:
+    """Mesh each payload variant once per run; callers must not mutate the result.
+
+    The canonical export is only built for callers that inspect it; a cached
+    canonical build also serves callers that just need the .msh text.
+    """
+    key = (sim_type, quadrants, morph)
+    result = _MESH_CACHE.get(key)
+    if result is None or (include_canonical and "canonical_mesh" not in result):
+        payload = _payload(sim_type=sim_type, quadrants=quadrants, morph=morph)
+        result = build_waveguide_mesh(payload, include_canonical=include_canonical)
+        _MESH_CACHE[key] = result
+    return result
+
+
+def _solve_full_3d(*, sim_type: int, quadrants: int = 1234, morph: bool = False) -> dict:
+    payload = _payload(sim_type=sim_type, quadrants=quadrants, morph=morph)
+    mesh_result = _built_mesh(sim_type, quadrants, morph, include_canonical=False)
     metadata = mesh_result.get("metadata") or mesh_result.get("stats", {}).get("metadata")
     with tempfile.NamedTemporaryFile(suffix=".msh", mode="w", encoding="utf-8") as msh_file:
         msh_file.write(mesh_result["msh_text"])
@@ -157,17 +176,17 @@ def _forward_directivity_db(result: dict) -> np.ndarray:
 @unittest.skipUnless(_mesher_runtime_ready(), "hornlab-waveguide-mesher runtime not available")
 class InfiniteBaffleCoupledMeshIntegrationTest(unittest.TestCase):
     def test_wg_adapter_builds_ib_mesh_with_z0_aperture_tag(self):
-        result = build_waveguide_mesh(_payload(sim_type=1), include_canonical=True)
+        result = _built_mesh(1)
         canonical = result["canonical_mesh"]
         verts = np.asarray(canonical["vertices"], dtype=float).reshape(-1, 3)
         tris = np.asarray(canonical["indices"], dtype=np.int64).reshape(-1, 3)
         tags = np.asarray(canonical["surfaceTags"], dtype=np.int32)
 
-        self.assertIn(2, set(int(tag) for tag in tags))
-        self.assertNotIn(4, set(int(tag) for tag in tags))
+        present_tags = set(np.unique(tags).tolist())
+        self.assertIn(2, present_tags)
         self.assertEqual(result["metadata"]["apertureTag"], 12)
-        self.assertIn(12, set(int(tag) for tag in tags))
-        self.assertNotIn(4, set(int(tag) for tag in tags))
+        self.assertIn(12, present_tags)
+        self.assertNotIn(4, present_tags)
         # The coupled aperture mesh lives in z <= 0: source and inner wall form
         # the recessed interior, and tag 12 is the planar Rayleigh aperture cap.
         self.assertLessEqual(float(np.max(verts[:, 2])), 1.0e-9)
@@ -177,22 +196,22 @@ class InfiniteBaffleCoupledMeshIntegrationTest(unittest.TestCase):
         p2 = verts[tris[:, 2]]
         signed_volume = float(np.sum(p0 * np.cross(p1, p2)) / 6.0)
         self.assertLess(signed_volume, 0.0)
+        # Only the z components of the (unnormalised) face normals are
+        # asserted on, so compute them once for every face and mask by tag.
+        e1 = p1 - p0
+        e2 = p2 - p0
+        face_z = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
         source = tags == 2
-        source_z_projection = float(
-            np.sum(np.cross(p1[source] - p0[source], p2[source] - p0[source])[:, 2])
-        )
+        source_z_projection = float(np.sum(face_z[source]))
         # Source cap sits at the throat; its normal points +z into the air column
         # toward the mouth on z=0.
         self.assertGreater(source_z_projection, 0.0)
 
         aperture = tags == 12
         self.assertGreater(int(np.count_nonzero(aperture)), 0)
-        aperture_z = np.abs(verts[tris[aperture]][:, :, 2])
+        aperture_z = np.abs(verts[tris[aperture], 2])
         self.assertLessEqual(float(np.max(aperture_z)), 1.0e-9)
-        aperture_face_z = np.cross(
-            p1[aperture] - p0[aperture],
-            p2[aperture] - p0[aperture],
-        )[:, 2]
+        aperture_face_z = face_z[aperture]
         aperture_z_projection = float(np.sum(aperture_face_z))
         # Canonical coupled-IB meshes describe the interior cavity domain:
         # source normals point +Z toward the mouth, while every Rayleigh
@@ -201,7 +220,7 @@ class InfiniteBaffleCoupledMeshIntegrationTest(unittest.TestCase):
         self.assertTrue(np.all(aperture_face_z < 0.0))
         self.assertLess(aperture_z_projection, 0.0)
 
-        edges = _open_boundary_edges(tris)
+        edges = open_boundary_edges(tris)
         self.assertEqual(len(edges), 0, "full-domain coupled aperture mesh should be closed")
 
 
@@ -254,7 +273,7 @@ class InfiniteBaffleCoupledSolveIntegrationTest(unittest.TestCase):
             payload,
             _request(payload, solver_mode="circsym"),
         )
-        full_3d = _solve_full_3d(payload)
+        full_3d = _solve_full_3d(sim_type=1)
 
         self.assertEqual(circsym["metadata"]["infinite_baffle"]["backend"], "circsym_coupled")
         self.assertEqual(full_3d["metadata"]["infinite_baffle"]["backend"], "full_3d_coupled")
@@ -262,11 +281,8 @@ class InfiniteBaffleCoupledSolveIntegrationTest(unittest.TestCase):
         self.assertLessEqual(float(delta_db), 1.0)
 
     def test_tritonia_class_quarter_and_full_domain_coupled_ib_match(self):
-        full_payload = _payload(sim_type=1, quadrants=1234, morph=True)
-        quarter_payload = _payload(sim_type=1, quadrants=1, morph=True)
-
-        full_domain = _solve_full_3d(full_payload)
-        quarter = _solve_full_3d(quarter_payload)
+        full_domain = _solve_full_3d(sim_type=1, quadrants=1234, morph=True)
+        quarter = _solve_full_3d(sim_type=1, quadrants=1, morph=True)
 
         self.assertIsNone(full_domain["metadata"]["metal"]["native_symmetry_plane"])
         self.assertEqual(quarter["metadata"]["metal"]["native_symmetry_plane"], "yz+xz")
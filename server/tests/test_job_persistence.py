@@ -1,4 +1,4 @@
-import asyncio
+import json
 import sqlite3
 import tempfile
 import unittest
@@ -17,37 +17,52 @@ from api.routes_simulation import (
     patch_job_metadata,
 )
 from contracts import JobMetadataPatch, SimulationRequest
-from db import SimulationDB
+from db import ALLOWED_STATUSES, SCHEMA_VERSION, SimulationDB
 from fastapi import HTTPException
 import services.job_runtime as _jrt
+from tests.loop_fixtures import SharedLoopTestCase
+from tests.simulation_fixtures import MSH_TEXT, isolate_job_runtime
+
+
+class JobPersistenceTest(SharedLoopTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One private in-memory database serves the whole class; tearDown
+        # empties it, so no test pays for a temp directory or schema build.
+        cls.shared_db = SimulationDB.in_memory()
+        cls.shared_db.initialize()
+        cls.addClassCleanup(cls.shared_db.close)
+        # Every seeded row stores the same config; serialize it once per class.
+        cls._config_json = json.dumps(cls._request_dump())
+        cls._config_summary_json = json.dumps({
+            "formula_type": "OSSE",
+            "frequency_range": [100.0, 1000.0],
+            "num_frequencies": 8,
+            "sim_type": "2",
+        })
 
-
-class JobPersistenceTest(unittest.TestCase):
     def setUp(self):
-        self.tmp = tempfile.TemporaryDirectory()
         self.original_db = _jrt.db
         self.original_db_initialized = _jrt.db_initialized
+        isolate_job_runtime(self)
 
-        _jrt.jobs.clear()
-        _jrt.job_queue.clear()
-        _jrt.running_jobs.clear()
-        _jrt.scheduler_loop_running = False
-
-        new_db = SimulationDB(Path(self.tmp.name) / "simulations.db")
-        _jrt.db = new_db
-        _jrt.db_initialized = False
-        _jrt.ensure_db_ready()
+        _jrt.db = self.shared_db
+        _jrt.db_initialized = True
 
     def tearDown(self):
+        # Results and mesh artifacts go with their jobs (ON DELETE CASCADE).
+        self.shared_db.delete_jobs_by_status(sorted(ALLOWED_STATUSES))
         _jrt.db = self.original_db
         _jrt.db_initialized = self.original_db_initialized
-        _jrt.jobs.clear()
-        _jrt.job_queue.clear()
-        _jrt.running_jobs.clear()
-        _jrt.scheduler_loop_running = False
-        self.tmp.cleanup()
 
-    def _request_dump(self):
+    def _scratch_dir(self) -> Path:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        return Path(tmp.name)
+
+    @staticmethod
+    def _request_dump():
         return {
             "mesh": {
                 "vertices": [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0],
@@ -69,44 +84,46 @@ class JobPersistenceTest(unittest.TestCase):
             "device_mode": "auto",
         }
 
-    def _create_db_job(self, job_id: str, status: str):
+    def _db_job(self, job_id: str, status: str):
         now = "2026-02-22T18:20:31.305018"
-        _jrt.db.create_job(
-            {
-                "id": job_id,
-                "status": status,
-                "created_at": now,
-                "updated_at": now,
-                "queued_at": now,
-                "started_at": now if status == "running" else None,
-                "completed_at": now if status in {"complete", "error", "cancelled"} else None,
-                "progress": 0.0,
-                "stage": status,
-                "stage_message": f"{status} stage",
-                "error_message": None,
-                "cancellation_requested": False,
-                "config_json": self._request_dump(),
-                "config_summary_json": {
-                    "formula_type": "OSSE",
-                    "frequency_range": [100.0, 1000.0],
-                    "num_frequencies": 8,
-                    "sim_type": "2",
-                },
-                "has_results": status == "complete",
-                "has_mesh_artifact": False,
-                "mesh_stats": None,
-                "label": None,
-            }
+        return {
+            "id": job_id,
+            "status": status,
+            "created_at": now,
+            "updated_at": now,
+            "queued_at": now,
+            "started_at": now if status == "running" else None,
+            "completed_at": now if status in {"complete", "error", "cancelled"} else None,
+            "progress": 0.0,
+            "stage": status,
+            "stage_message": f"{status} stage",
+            "error_message": None,
+            "cancellation_requested": False,
+            "config_json": self._config_json,
+            "config_summary_json": self._config_summary_json,
+            "has_results": status == "complete",
+            "has_mesh_artifact": False,
+            "mesh_stats": None,
+            "label": None,
+        }
+
+    def _create_db_job(self, job_id: str, status: str):
+        _jrt.db.create_job(self._db_job(job_id, status), preserialized=True)
+
+    def _create_db_jobs(self, *specs):
+        """Seed several ``(job_id, status)`` rows in one transaction."""
+        _jrt.db.create_jobs(
+            [self._db_job(job_id, status) for job_id, status in specs],
+            preserialized=True,
         )
 
     def test_startup_recovery_marks_running_error_and_requeues_queued(self):
-        self._create_db_job("job-running", "running")
-        self._create_db_job("job-queued", "queued")
+        self._create_db_jobs(("job-running", "running"), ("job-queued", "queued"))
 
         with patch("services.job_runtime._keep_task", lambda _task: None), \
              patch("services.job_runtime.asyncio.create_task") as create_task:
             create_task.side_effect = lambda coro: (coro.close(), None)[1]
-            asyncio.run(_jrt.startup_jobs_runtime())
+            self._run(_jrt.startup_jobs_runtime())
 
         recovered_running = _jrt.db.get_job_row("job-running")
         self.assertEqual(recovered_running["status"], "error")
@@ -137,31 +154,54 @@ class JobPersistenceTest(unittest.TestCase):
         self.assertEqual(row["config_summary_json"]["sim_type"], "2")
         create_task.assert_called_once()
 
+    def test_create_job_round_trips_dict_and_string_configs(self):
+        dict_job = self._db_job("job-dict", "queued")
+        dict_job["config_json"] = {"formula_type": "OSSE", "scale": 1.0}
+        dict_job["config_summary_json"] = {"formula_type": "OSSE"}
+        string_job = self._db_job("job-string", "queued")
+        string_job["config_json"] = "abc"
+        string_job["config_summary_json"] = "summary"
+        _jrt.db.create_jobs([dict_job, string_job])
+        _jrt.db.create_job(self._db_job("job-preserialized", "queued"), preserialized=True)
+
+        stored_dict = _jrt.db.get_job_row("job-dict")
+        self.assertEqual(stored_dict["config_json"], {"formula_type": "OSSE", "scale": 1.0})
+        self.assertEqual(stored_dict["config_summary_json"], {"formula_type": "OSSE"})
+        stored_string = _jrt.db.get_job_row("job-string")
+        self.assertEqual(stored_string["config_json"], "abc")
+        self.assertEqual(stored_string["config_summary_json"], "summary")
+        stored_preserialized = _jrt.db.get_job_row("job-preserialized")
+        self.assertEqual(stored_preserialized["config_json"], json.loads(self._config_json))
+        self.assertEqual(
+            stored_preserialized["config_summary_json"], json.loads(self._config_summary_json)
+        )
+
     def test_delete_job_rejects_active_and_allows_terminal(self):
-        self._create_db_job("job-active", "queued")
-        self._create_db_job("job-complete", "complete")
+        self._create_db_jobs(("job-active", "queued"), ("job-complete", "complete"))
 
         _jrt.jobs["job-active"] = {"id": "job-active", "status": "queued"}
         _jrt.jobs["job-complete"] = {"id": "job-complete", "status": "complete"}
 
         with self.assertRaises(HTTPException) as active_ctx:
-            asyncio.run(delete_job("job-active"))
+            self._run(delete_job("job-active"))
         self.assertEqual(active_ctx.exception.status_code, 409)
 
-        resp = asyncio.run(delete_job("job-complete"))
+        resp = self._run(delete_job("job-complete"))
         self.assertEqual(resp["deleted"], True)
         self.assertIsNone(_jrt.db.get_job_row("job-complete"))
 
     def test_clear_failed_jobs_deletes_failed_from_db_and_runtime_cache(self):
-        self._create_db_job("job-error-1", "error")
-        self._create_db_job("job-error-2", "error")
-        self._create_db_job("job-complete", "complete")
+        self._create_db_jobs(
+            ("job-error-1", "error"),
+            ("job-error-2", "error"),
+            ("job-complete", "complete"),
+        )
 
         _jrt.jobs["job-error-1"] = {"id": "job-error-1", "status": "error"}
         _jrt.jobs["job-error-2"] = {"id": "job-error-2", "status": "error"}
         _jrt.jobs["job-complete"] = {"id": "job-complete", "status": "complete"}
 
-        resp = asyncio.run(clear_failed_jobs())
+        resp = self._run(clear_failed_jobs())
         self.assertEqual(resp["deleted"], True)
         self.assertEqual(resp["deleted_count"], 2)
         self.assertCountEqual(resp["deleted_ids"], ["job-error-1", "job-error-2"])
@@ -175,11 +215,13 @@ class JobPersistenceTest(unittest.TestCase):
         self.assertIn("job-complete", _jrt.jobs)
 
     def test_list_jobs_supports_status_filter_and_pagination(self):
-        self._create_db_job("job-1", "complete")
-        self._create_db_job("job-2", "error")
-        self._create_db_job("job-3", "queued")
+        self._create_db_jobs(
+            ("job-1", "complete"),
+            ("job-2", "error"),
+            ("job-3", "queued"),
+        )
 
-        resp = asyncio.run(list_jobs(status="complete,error", limit=1, offset=0))
+        resp = self._run(list_jobs(status="complete,error", limit=1, offset=0))
         self.assertEqual(resp["limit"], 1)
         self.assertEqual(resp["offset"], 0)
         self.assertEqual(resp["total"], 2)
@@ -187,17 +229,69 @@ class JobPersistenceTest(unittest.TestCase):
         self.assertIn(resp["items"][0]["status"], {"complete", "error"})
 
     def test_results_and_mesh_artifact_loaded_from_sqlite(self):
-        self._create_db_job("job-finished", "complete")
-        _jrt.db.store_results("job-finished", {"frequencies": [100], "directivity": {}})
-        _jrt.db.store_mesh_artifact("job-finished", "$MeshFormat\n2.2 0 8\n$EndMeshFormat\n")
+        with _jrt.db.transaction():
+            self._create_db_job("job-finished", "complete")
+            _jrt.db.store_results("job-finished", {"frequencies": [100], "directivity": {}})
+            _jrt.db.store_mesh_artifact("job-finished", MSH_TEXT)
 
         _jrt.jobs.clear()
-        results = asyncio.run(get_results("job-finished"))
+        results = self._run(get_results("job-finished"))
         self.assertEqual(results["frequencies"], [100])
 
-        mesh_resp = asyncio.run(get_mesh_artifact("job-finished"))
+        mesh_resp = self._run(get_mesh_artifact("job-finished"))
         self.assertIn("$MeshFormat", mesh_resp.body.decode())
 
+    def test_failed_transaction_rolls_back_every_write(self):
+        with self.assertRaises(RuntimeError):
+            with _jrt.db.transaction():
+                self._create_db_job("job-partial", "complete")
+                _jrt.db.store_results("job-partial", {"frequencies": [100]})
+                raise RuntimeError("abort")
+
+        self.assertIsNone(_jrt.db.get_job_row("job-partial"))
+        self.assertIsNone(_jrt.db.get_results("job-partial"))
+
+    def test_results_are_stored_compressed_and_legacy_json_still_loads(self):
+        results = {"frequencies": [100.0, 200.0], "spl": [90.5, 91.25], "directivity": {}}
+        self._create_db_jobs(("job-new", "complete"), ("job-legacy", "complete"))
+        _jrt.db.store_results("job-new", results)
+        with _jrt.db._managed_connection() as conn:
+            conn.execute(
+                "INSERT INTO simulation_results (job_id, results_json) VALUES (?, ?)",
+                ("job-legacy", json.dumps(results)),
+            )
+            stored = conn.execute(
+                "SELECT results_json, results_encoding FROM simulation_results WHERE job_id = ?",
+                ("job-new",),
+            ).fetchone()
+
+        self.assertIsInstance(stored["results_json"], bytes)
+        self.assertEqual(stored["results_encoding"], "zlib")
+        loaded = _jrt.db.get_results("job-new")
+        self.assertIsInstance(loaded, dict)
+        self.assertEqual(loaded, results)
+        self.assertEqual(_jrt.db.get_results("job-legacy"), results)
+
+    def test_mesh_artifact_is_stored_compressed_and_legacy_text_still_loads(self):
+        self._create_db_jobs(("job-new", "complete"), ("job-legacy", "complete"))
+        _jrt.db.store_mesh_artifact("job-new", MSH_TEXT)
+        with _jrt.db._managed_connection() as conn:
+            conn.execute(
+                "INSERT INTO simulation_artifacts (job_id, msh_text) VALUES (?, ?)",
+                ("job-legacy", MSH_TEXT),
+            )
+            stored = conn.execute(
+                "SELECT msh_text, msh_encoding FROM simulation_artifacts WHERE job_id = ?",
+                ("job-new",),
+            ).fetchone()
+
+        self.assertIsInstance(stored["msh_text"], bytes)
+        self.assertEqual(stored["msh_encoding"], "zlib")
+        loaded = _jrt.db.get_mesh_artifact("job-new")
+        self.assertIsInstance(loaded, str)
+        self.assertEqual(loaded, MSH_TEXT)
+        self.assertEqual(_jrt.db.get_mesh_artifact("job-legacy"), MSH_TEXT)
+
     def test_list_jobs_preserves_persisted_mesh_stats_payload(self):
         self._create_db_job("job-complete", "complete")
         _jrt.db.update_job(
@@ -209,7 +303,7 @@ class JobPersistenceTest(unittest.TestCase):
         )
 
         _jrt.jobs.clear()
-        resp = asyncio.run(list_jobs(status="complete", limit=10, offset=0))
+        resp = self._run(list_jobs(status="complete", limit=10, offset=0))
 
         self.assertEqual(resp["total"], 1)
         self.assertEqual(resp["items"][0]["mesh_stats"]["vertex_count"], 42)
@@ -236,7 +330,7 @@ class JobPersistenceTest(unittest.TestCase):
             "get_job_row",
             side_effect=AssertionError("list_jobs must not re-query selected rows"),
         ):
-            response = asyncio.run(list_jobs(status="complete", limit=10, offset=0))
+            response = self._run(list_jobs(status="complete", limit=10, offset=0))
 
         self.assertEqual(response["total"], 1)
         item = response["items"][0]
@@ -256,7 +350,7 @@ class JobPersistenceTest(unittest.TestCase):
             ),
         )
 
-        status = asyncio.run(get_job_status("job-running"))
+        status = self._run(get_job_status("job-running"))
 
         self.assertEqual(status.mesh_stats["vertex_count"], 42)
         self.assertEqual(status.mesh_stats["triangle_count"], 20)
@@ -279,7 +373,7 @@ class JobPersistenceTest(unittest.TestCase):
     def test_patch_job_metadata_persists_normalized_label_and_script_snapshot(self):
         self._create_db_job("job-complete", "complete")
 
-        resp = asyncio.run(
+        resp = self._run(
             patch_job_metadata(
                 "job-complete",
                 JobMetadataPatch(
@@ -291,7 +385,7 @@ class JobPersistenceTest(unittest.TestCase):
         self.assertEqual(resp["status"], "ok")
 
         _jrt.jobs.clear()
-        listed = asyncio.run(list_jobs(status="complete", limit=10, offset=0))
+        listed = self._run(list_jobs(status="complete", limit=10, offset=0))
         item = listed["items"][0]
         self.assertEqual(item["label"], "measurement pass")
         self.assertEqual(item["script_snapshot"]["schemaVersion"], 1)
@@ -299,14 +393,14 @@ class JobPersistenceTest(unittest.TestCase):
 
     def test_patch_job_metadata_can_clear_label_and_script_snapshot(self):
         self._create_db_job("job-complete", "complete")
-        asyncio.run(
+        self._run(
             patch_job_metadata(
                 "job-complete",
                 JobMetadataPatch(label="measurement pass", script_snapshot={"params": {}}),
             )
         )
 
-        asyncio.run(
+        self._run(
             patch_job_metadata(
                 "job-complete",
                 JobMetadataPatch(label="", script_snapshot=None),
@@ -314,13 +408,13 @@ class JobPersistenceTest(unittest.TestCase):
         )
 
         _jrt.jobs.clear()
-        listed = asyncio.run(list_jobs(status="complete", limit=10, offset=0))
+        listed = self._run(list_jobs(status="complete", limit=10, offset=0))
         self.assertIsNone(listed["items"][0]["label"])
         self.assertIsNone(listed["items"][0]["script_snapshot"])
 
     def test_patch_job_metadata_persists_task_rating_and_export_state(self):
         self._create_db_job("job-complete", "complete")
-        asyncio.run(
+        self._run(
             patch_job_metadata(
                 "job-complete",
                 JobMetadataPatch(
@@ -334,7 +428,7 @@ class JobPersistenceTest(unittest.TestCase):
         )
 
         _jrt.jobs.clear()
-        item = asyncio.run(list_jobs(status="complete", limit=10, offset=0))["items"][0]
+        item = self._run(list_jobs(status="complete", limit=10, offset=0))["items"][0]
         self.assertEqual(item["rating"], 4)
         self.assertEqual(item["exported_files"], ["csv:results.csv", "json:results.json"])
         self.assertEqual(item["auto_export_completed_at"], "2026-07-10T12:00:00Z")
@@ -342,11 +436,13 @@ class JobPersistenceTest(unittest.TestCase):
         self.assertEqual(item["mesh_artifact_file"], "solver.mesh.msh")
 
     def test_initialize_migrates_version_three_database_for_task_metadata(self):
-        db_path = Path(self.tmp.name) / "version-three.db"
+        db_path = self._scratch_dir() / "version-three.db"
         legacy_db = SimulationDB(db_path)
         legacy_db.initialize()
         with closing(sqlite3.connect(db_path)) as conn:
             conn.execute("ALTER TABLE simulation_jobs DROP COLUMN task_metadata_json")
+            conn.execute("ALTER TABLE simulation_results DROP COLUMN results_encoding")
+            conn.execute("ALTER TABLE simulation_artifacts DROP COLUMN msh_encoding")
             conn.execute("PRAGMA user_version = 3")
             conn.commit()
 
@@ -356,10 +452,43 @@ class JobPersistenceTest(unittest.TestCase):
             columns = {
                 row[1] for row in conn.execute("PRAGMA table_info(simulation_jobs)").fetchall()
             }
+            result_columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(simulation_results)").fetchall()
+            }
+            artifact_columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(simulation_artifacts)").fetchall()
+            }
             user_version = conn.execute("PRAGMA user_version").fetchone()[0]
 
         self.assertIn("task_metadata_json", columns)
-        self.assertEqual(user_version, 4)
+        self.assertIn("results_encoding", result_columns)
+        self.assertIn("msh_encoding", artifact_columns)
+        self.assertEqual(user_version, SCHEMA_VERSION)
+
+    def test_initialize_skips_schema_ddl_at_current_version(self):
+        db = SimulationDB(self._scratch_dir() / "current.db")
+        connect = db._connect
+
+        def traced_initialize():
+            statements = []
+
+            def traced_connect():
+                conn = connect()
+                conn.set_trace_callback(statements.append)
+                return conn
+
+            with patch.object(db, "_connect", traced_connect):
+                db.initialize()
+            return [
+                statement.strip().split(None, 1)[0].upper()
+                for statement in statements
+            ]
+
+        self.assertIn("CREATE", traced_initialize())
+        second_run = traced_initialize()
+        self.assertIn("PRAGMA", second_run)
+        self.assertNotIn("CREATE", second_run)
+        self.assertNotIn("ALTER", second_run)
 
     def test_prune_terminal_jobs_closes_database_connection(self):
         class FakeCursor:
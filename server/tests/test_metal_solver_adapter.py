@@ -1,39 +1,45 @@
 import json
-import math
 import tempfile
 import unittest
 from types import ModuleType, SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 
 from contracts import MeshData, PolarConfig, SimulationRequest
 from solver import metal_solver
 from solver.result_mapping import REFERENCE_RHO_C
-
-
-class FakeObservationConfig:
-    def __init__(
-        self,
-        *,
-        planes,
-        distance_m,
-        angle_min_deg,
-        angle_max_deg,
-        angle_count,
-        origin,
-    ):
-        self.planes = planes
-        self.distance_m = distance_m
-        self.angle_min_deg = angle_min_deg
-        self.angle_max_deg = angle_max_deg
-        self.angle_count = angle_count
-        self.origin = origin
-
-
-class FakeSolveConfig:
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
+from tests.solver_adapter_fixtures import (
+    FakeObservationConfig,
+    FakeSolveConfig,
+    readonly_array,
+)
+
+# Fake solver output, built once at import and shared by every test.
+_RESULT_FREQUENCIES_HZ = readonly_array([1000.0, 2000.0], float)
+_RESULT_ANGLES_DEG = readonly_array([0.0, 90.0, 180.0], float)
+_RESULT_PRESSURE = readonly_array(
+    [
+        [[2.0e-5 + 0j, 1.0e-5 + 0j, 5.0e-6 + 0j]],
+        [[2.0e-4 + 0j, 1.0e-4 + 0j, 5.0e-5 + 0j]],
+    ],
+    np.complex128,
+)
+_RESULT_DIRECTIVITY_DB = readonly_array(
+    [
+        [[0.0, -6.0, -12.0]],
+        [[0.0, -6.0, -12.0]],
+    ],
+    float,
+)
+# raw <p> for a radiating case under the corrected acceleration
+# mapping (v = a/(-i*omega)): sign-flipped vs the pre-2026-07-09 fakes
+_RESULT_RAW_IMPEDANCE = readonly_array([-1.0 + 2.0j, -3.0 + 4.0j], np.complex128)
+
+_MERIDIAN_NODES = readonly_array([[0.0, -0.1], [0.0127, -0.1], [0.08, 0.0]], float)
+_MERIDIAN_SEGMENTS = readonly_array([[0, 1], [1, 2]], np.int32)
+_MERIDIAN_PHYSICAL_TAGS = readonly_array([2, 1], np.int32)
+_MERIDIAN_NORMALS = readonly_array([[0.0, 1.0], [-0.8, 0.6]], float)
 
 
 class FakeMeridianMesh:
@@ -51,10 +57,10 @@ class FakeMeridianBuild:
 
     def as_metal_meridian(self, meridian_cls):
         return meridian_cls(
-            nodes=np.array([[0.0, -0.1], [0.0127, -0.1], [0.08, 0.0]], dtype=float),
-            segments=np.array([[0, 1], [1, 2]], dtype=np.int32),
-            physical_tags=np.array([2, 1], dtype=np.int32),
-            normals=np.array([[0.0, 1.0], [-0.8, 0.6]], dtype=float),
+            nodes=_MERIDIAN_NODES,
+            segments=_MERIDIAN_SEGMENTS,
+            physical_tags=_MERIDIAN_PHYSICAL_TAGS,
+            normals=_MERIDIAN_NORMALS,
         )
 
 
@@ -107,26 +113,12 @@ class MetalSolverAdapterTest(unittest.TestCase):
 
     def _fake_result(self):
         return SimpleNamespace(
-            frequencies_hz=np.array([1000.0, 2000.0], dtype=float),
-            observation_angles_deg=np.array([0.0, 90.0, 180.0], dtype=float),
+            frequencies_hz=_RESULT_FREQUENCIES_HZ,
+            observation_angles_deg=_RESULT_ANGLES_DEG,
             observation_planes=["horizontal"],
-            pressure_complex=np.array(
-                [
-                    [[2.0e-5 + 0j, 1.0e-5 + 0j, 5.0e-6 + 0j]],
-                    [[2.0e-4 + 0j, 1.0e-4 + 0j, 5.0e-5 + 0j]],
-                ],
-                dtype=np.complex128,
-            ),
-            directivity_db=np.array(
-                [
-                    [[0.0, -6.0, -12.0]],
-                    [[0.0, -6.0, -12.0]],
-                ],
-                dtype=float,
-            ),
-            # raw <p> for a radiating case under the corrected acceleration
-            # mapping (v = a/(-i*omega)): sign-flipped vs the pre-2026-07-09 fakes
-            impedance=np.array([-1.0 + 2.0j, -3.0 + 4.0j], dtype=np.complex128),
+            pressure_complex=_RESULT_PRESSURE,
+            directivity_db=_RESULT_DIRECTIVITY_DB,
+            impedance=_RESULT_RAW_IMPEDANCE,
             timings={"total_s": 0.1},
             solver_log=[
                 {"frequency_hz": np.float64(1000.0), "impedance": 1.0 + 2.0j},
@@ -134,6 +126,18 @@ class MetalSolverAdapterTest(unittest.TestCase):
             native_diagnostics=[],
         )
 
+    def _patch_native(self, *, native_config=FakeSolveConfig, solve=None):
+        """Stand in for metal-bem's native entry points during a full-3D solve."""
+        return patch.multiple(
+            metal_solver,
+            ObservationConfig=FakeObservationConfig,
+            native_config=native_config,
+            solve=solve if solve is not None else MagicMock(return_value=self._fake_result()),
+            metal_backend_status=MagicMock(
+                return_value={"available": True, "supportedPlatform": True}
+            ),
+        )
+
     def test_reduced_quadrants_set_native_symmetry_plane(self):
         seen_configs = []
 
@@ -142,13 +146,8 @@ class MetalSolverAdapterTest(unittest.TestCase):
             seen_configs.append(cfg)
             return cfg
 
-        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, patch(
-            "solver.metal_solver.ObservationConfig", FakeObservationConfig
-        ), patch("solver.metal_solver.native_config", side_effect=fake_native_config), patch(
-            "solver.metal_solver.solve", return_value=self._fake_result()
-        ), patch(
-            "solver.metal_solver.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True},
+        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, self._patch_native(
+            native_config=fake_native_config,
         ):
             result = metal_solver.solve_metal_from_msh(msh_file.name, self._request(quadrants=1))
 
@@ -168,13 +167,8 @@ class MetalSolverAdapterTest(unittest.TestCase):
             config.progress_callback(0, 2, 1000.0)
             return self._fake_result()
 
-        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, patch(
-            "solver.metal_solver.ObservationConfig", FakeObservationConfig
-        ), patch("solver.metal_solver.native_config", side_effect=FakeSolveConfig), patch(
-            "solver.metal_solver.solve", side_effect=fake_solve
-        ), patch(
-            "solver.metal_solver.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True},
+        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, self._patch_native(
+            solve=fake_solve,
         ):
             metal_solver.solve_metal_from_msh(
                 msh_file.name,
@@ -193,13 +187,9 @@ class MetalSolverAdapterTest(unittest.TestCase):
 
         self.assertIsNone(metal_solver._native_symmetry_plane(request))
 
-        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, patch(
-            "solver.metal_solver.ObservationConfig", FakeObservationConfig
-        ), patch("solver.metal_solver.native_config") as native_config_mock, patch(
-            "solver.metal_solver.solve", return_value=self._fake_result()
-        ), patch(
-            "solver.metal_solver.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True},
+        native_config_mock = MagicMock()
+        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, self._patch_native(
+            native_config=native_config_mock,
         ):
             with self.assertRaisesRegex(metal_solver.MetalBemUnavailable, "aperture tag"):
                 metal_solver.solve_metal_from_msh(msh_file.name, request)
@@ -219,13 +209,8 @@ class MetalSolverAdapterTest(unittest.TestCase):
             seen_configs.append(cfg)
             return cfg
 
-        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, patch(
-            "solver.metal_solver.ObservationConfig", FakeObservationConfig
-        ), patch("solver.metal_solver.native_config", side_effect=fake_native_config), patch(
-            "solver.metal_solver.solve", return_value=self._fake_result()
-        ), patch(
-            "solver.metal_solver.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True},
+        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, self._patch_native(
+            native_config=fake_native_config,
         ):
             result = metal_solver.solve_metal_from_msh(
                 msh_file.name,
@@ -260,13 +245,8 @@ class MetalSolverAdapterTest(unittest.TestCase):
         def fake_native_config(**_kwargs):
             raise TypeError("got an unexpected keyword argument 'aperture_tag'")
 
-        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, patch(
-            "solver.metal_solver.ObservationConfig", FakeObservationConfig
-        ), patch("solver.metal_solver.native_config", side_effect=fake_native_config), patch(
-            "solver.metal_solver.solve", return_value=self._fake_result()
-        ), patch(
-            "solver.metal_solver.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True},
+        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, self._patch_native(
+            native_config=fake_native_config,
         ):
             with self.assertRaisesRegex(
                 metal_solver.MetalBemUnavailable,
@@ -286,13 +266,8 @@ class MetalSolverAdapterTest(unittest.TestCase):
             seen_configs.append(cfg)
             return cfg
 
-        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, patch(
-            "solver.metal_solver.ObservationConfig", FakeObservationConfig
-        ), patch("solver.metal_solver.native_config", side_effect=fake_native_config), patch(
-            "solver.metal_solver.solve", return_value=self._fake_result()
-        ), patch(
-            "solver.metal_solver.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True},
+        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, self._patch_native(
+            native_config=fake_native_config,
         ):
             metal_solver.solve_metal_from_msh(
                 msh_file.name,
@@ -309,14 +284,7 @@ class MetalSolverAdapterTest(unittest.TestCase):
         self.assertEqual(seen_configs[0].complex_k_shift, 0.0125)
 
     def test_burton_miller_is_rejected_for_metal(self):
-        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, patch(
-            "solver.metal_solver.native_config", side_effect=lambda **kwargs: FakeSolveConfig(**kwargs)
-        ), patch(
-            "solver.metal_solver.solve", return_value=self._fake_result()
-        ), patch(
-            "solver.metal_solver.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True},
-        ):
+        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, self._patch_native():
             with self.assertRaises(ValueError):
                 metal_solver.solve_metal_from_msh(
                     msh_file.name,
@@ -387,14 +355,7 @@ class MetalSolverAdapterTest(unittest.TestCase):
         )
 
     def test_result_packaging_uses_actual_on_axis_spl_and_di(self):
-        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, patch(
-            "solver.metal_solver.ObservationConfig", FakeObservationConfig
-        ), patch("solver.metal_solver.native_config", side_effect=lambda **kwargs: FakeSolveConfig(**kwargs)), patch(
-            "solver.metal_solver.solve", return_value=self._fake_result()
-        ), patch(
-            "solver.metal_solver.metal_backend_status",
-            return_value={"available": True, "supportedPlatform": True},
-        ):
+        with tempfile.NamedTemporaryFile(suffix=".msh") as msh_file, self._patch_native():
             result = metal_solver.solve_metal_from_msh(msh_file.name, self._request(quadrants=1234))
 
         spl = result["spl_on_axis"]["spl"]
@@ -404,7 +365,7 @@ class MetalSolverAdapterTest(unittest.TestCase):
         self.assertEqual(result["spl_on_axis"]["phase_degrees"], [0.0, 0.0])
         self.assertIn("horizontal", result["di"]["di"])
         self.assertEqual(len(result["di"]["di"]["horizontal"]), 2)
-        self.assertTrue(all(math.isfinite(value) for value in result["di"]["di"]["horizontal"]))
+        self.assertTrue(np.isfinite(result["di"]["di"]["horizontal"]).all())
         raw_impedance = self._fake_result().impedance
         expected = np.conjugate(
             -1j * 2.0 * np.pi * self._fake_result().frequencies_hz * raw_impedance
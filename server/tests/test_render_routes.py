@@ -15,6 +15,9 @@ from contracts import (
 )
 import services.solver_runtime as solver_runtime
 
+# The route handlers only read the request, so one validated instance is shared.
+_MINIMAL_CHARTS_REQUEST = ChartsRenderRequest(frequencies=[100.0], spl=[90.0])
+
 
 class RenderReferenceContractsTest(unittest.TestCase):
     def test_reference_contracts_accept_pinned_shapes(self):
@@ -133,7 +136,7 @@ class RenderRoutesTest(unittest.TestCase):
         routes_misc._RENDER_CACHE.clear()
 
     def test_render_charts_without_directivity_does_not_produce_heatmap(self):
-        request = ChartsRenderRequest(frequencies=[100.0], spl=[90.0])
+        request = _MINIMAL_CHARTS_REQUEST
 
         def fake_render(payload):
             self.assertEqual(payload["directivity"], {})
@@ -202,7 +205,7 @@ class RenderRoutesTest(unittest.TestCase):
         self.assertEqual(second_bytes, png_bytes)
 
     def test_render_charts_cache_key_includes_optional_directivity(self):
-        without_map = ChartsRenderRequest(frequencies=[100.0], spl=[90.0])
+        without_map = _MINIMAL_CHARTS_REQUEST
         with_map = ChartsRenderRequest(
             frequencies=[100.0],
             spl=[90.0],
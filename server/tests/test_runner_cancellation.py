@@ -0,0 +1,196 @@
+import unittest
+from unittest.mock import patch
+
+from api.routes_simulation import stop_simulation
+import services.job_runtime as _jrt
+import services.simulation_runner as _sim_runner
+from tests.loop_fixtures import SharedLoopTestCase
+from tests.simulation_fixtures import (
+    construct_valid_request,
+    enable_hornlab_mesher_runtime,
+    running_job_entry,
+    single_triangle_mesher_result,
+)
+
+
+class StopSimulationLifecycleTest(SharedLoopTestCase):
+    def test_runtime_has_no_subprocess_cancellation_registry(self):
+        self.assertFalse(hasattr(_jrt, "running_processes"))
+        self.assertFalse(hasattr(_jrt, "register_solver_process"))
+        self.assertFalse(hasattr(_jrt, "unregister_solver_process"))
+
+    def test_stop_simulation_cancels_queued_job_immediately(self):
+        job_id = "test-stop-queued"
+        _jrt.jobs[job_id] = {
+            "id": job_id,
+            "status": "queued",
+            "progress": 0.0,
+            "stage": "queued",
+            "stage_message": "Job queued",
+            "error_message": None,
+            "cancellation_requested": False,
+        }
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+        _jrt.job_queue.append(job_id)
+        self.addCleanup(_jrt._remove_from_queue, job_id)
+        response = self._run(stop_simulation(job_id))
+
+        self.assertEqual(response["status"], "cancelled")
+        self.assertEqual(_jrt.jobs[job_id]["status"], "cancelled")
+        self.assertEqual(_jrt.jobs[job_id]["stage"], "cancelled")
+        self.assertFalse(_jrt.jobs[job_id]["cancellation_requested"])
+
+    def test_stop_simulation_marks_running_job_as_cancelling_until_worker_acknowledges(self):
+        job_id = "test-stop-running"
+        _jrt.jobs[job_id] = {
+            "id": job_id,
+            "status": "running",
+            "progress": 0.45,
+            "stage": "bem_solve",
+            "stage_message": "Solving frequency 2/5",
+            "error_message": None,
+            "completed_at": None,
+            "cancellation_requested": False,
+        }
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+        response = self._run(stop_simulation(job_id))
+
+        self.assertEqual(response["status"], "cancelling")
+        self.assertEqual(_jrt.jobs[job_id]["status"], "running")
+        self.assertEqual(_jrt.jobs[job_id]["stage"], "cancelling")
+        self.assertTrue(_jrt.jobs[job_id]["cancellation_requested"])
+        self.assertIsNone(_jrt.jobs[job_id].get("completed_at"))
+
+
+class CooperativeCancellationRunnerTest(SharedLoopTestCase):
+    def setUp(self):
+        enable_hornlab_mesher_runtime(self)
+
+    def _make_minimal_request(self):
+        return construct_valid_request(
+            num_frequencies=2,
+            solver_backend="metal",
+            # These cancellation tests patch the full-3D metal solve path; pin
+            # full_3d so 'auto' does not route this circular geometry to CircSym
+            # (which would call the real, unpatched solve_circsym_from_params).
+            solver_mode="full_3d",
+            options={"mesh": {"strategy": "hornlab_mesher", "waveguide_params": {
+                "formula_type": "OSSE",
+                "wall_thickness": 6.0,
+                "enc_depth": 0.0,
+            }}},
+        )
+
+    def _make_job_entry(self, job_id, *, cancellation_requested=False):
+        return running_job_entry(
+            job_id,
+            stage="bem_solve",
+            stage_message="Solving",
+            cancellation_requested=cancellation_requested,
+        )
+
+    def test_run_simulation_exits_cancelled_when_stop_was_requested_before_solver_work(self):
+        job_id = "test-runner-cancelled-before-start"
+        _jrt.jobs[job_id] = self._make_job_entry(job_id, cancellation_requested=True)
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+
+        def fail_if_meshed(*_args, **_kwargs):
+            raise AssertionError("mesh build must not run once cancellation is requested")
+
+        def fail_if_solved(*_args, **_kwargs):
+            raise AssertionError("metal solve must not run once cancellation is requested")
+
+        with patch.object(_sim_runner, "build_waveguide_mesh", side_effect=fail_if_meshed), \
+             patch.object(_sim_runner, "solve_metal_from_msh", side_effect=fail_if_solved):
+            self._run(_sim_runner.run_simulation(job_id, self._make_minimal_request()))
+
+        self.assertEqual(_jrt.jobs[job_id]["status"], "cancelled")
+        self.assertEqual(_jrt.jobs[job_id]["stage"], "cancelled")
+        self.assertFalse(_jrt.jobs[job_id]["cancellation_requested"])
+
+    def test_run_simulation_transitions_to_cancelled_when_solver_callback_acknowledges_stop(self):
+        job_id = "test-runner-cancelled-during-solve"
+        _jrt.jobs[job_id] = self._make_job_entry(job_id)
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+
+        def fake_metal_solve(*_args, **_kwargs):
+            _jrt.jobs[job_id]["cancellation_requested"] = True
+            raise _sim_runner.SimulationCancelled("Simulation cancelled by user")
+
+        with patch.object(_sim_runner, "build_waveguide_mesh", return_value=single_triangle_mesher_result()), \
+             patch.object(_sim_runner, "solve_metal_from_msh", side_effect=fake_metal_solve):
+            self._run(_sim_runner.run_simulation(job_id, self._make_minimal_request()))
+
+        self.assertEqual(_jrt.jobs[job_id]["status"], "cancelled")
+        self.assertEqual(_jrt.jobs[job_id]["stage"], "cancelled")
+        self.assertEqual(
+            _jrt.jobs[job_id]["error_message"],
+            "Simulation cancelled by user",
+        )
+
+    def test_full_3d_runner_forwards_live_cancellation_check_to_solver(self):
+        job_id = "test-runner-full-3d-cancellation-callback"
+        _jrt.jobs[job_id] = self._make_job_entry(job_id)
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+        callback_seen = []
+
+        def fake_metal_solve(*_args, cancellation_callback=None, **_kwargs):
+            self.assertIsNotNone(cancellation_callback)
+            callback_seen.append(True)
+            _jrt.jobs[job_id]["cancellation_requested"] = True
+            cancellation_callback()
+            raise AssertionError("cancellation callback must stop the solve")
+
+        with patch.object(_sim_runner, "build_waveguide_mesh", return_value=single_triangle_mesher_result()), \
+             patch.object(_sim_runner, "solve_metal_from_msh", side_effect=fake_metal_solve):
+            self._run(_sim_runner.run_simulation(job_id, self._make_minimal_request()))
+
+        self.assertEqual(callback_seen, [True])
+        self.assertEqual(_jrt.jobs[job_id]["status"], "cancelled")
+        self.assertEqual(_jrt.jobs[job_id]["stage"], "cancelled")
+
+    def test_full_3d_runner_rejects_mesher_mesh_without_source_tag_before_solve(self):
+        job_id = "test-runner-mesher-missing-source-tag"
+        _jrt.jobs[job_id] = self._make_job_entry(job_id)
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+        mesher_result = single_triangle_mesher_result()
+        mesher_result["canonical_mesh"]["surfaceTags"] = [1]
+
+        async def fake_mesher_worker(*_args, **_kwargs):
+            return mesher_result
+
+        with patch.object(_sim_runner, "build_waveguide_mesh", object()), \
+             patch.object(_sim_runner, "run_on_gmsh_worker", side_effect=fake_mesher_worker), \
+             patch.object(_sim_runner, "solve_metal_from_msh") as solve_metal:
+            self._run(_sim_runner.run_simulation(job_id, self._make_minimal_request()))
+
+        self.assertEqual(_jrt.jobs[job_id]["status"], "error")
+        self.assertIn("no source-tagged elements", _jrt.jobs[job_id]["error_message"])
+        solve_metal.assert_not_called()
+
+    def test_run_simulation_maps_internal_substages_to_core_job_stages(self):
+        job_id = "test-runner-core-stage-contract"
+        _jrt.jobs[job_id] = self._make_job_entry(job_id)
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+
+        def fake_metal_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        with patch.object(_sim_runner, "build_waveguide_mesh", return_value=single_triangle_mesher_result()), \
+             patch.object(_sim_runner, "solve_metal_from_msh", side_effect=fake_metal_solve), \
+             patch.object(_sim_runner, "update_job_stage") as update_stage_mock:
+            self._run(_sim_runner.run_simulation(job_id, self._make_minimal_request()))
+
+        stages = [
+            call.args[1]
+            for call in update_stage_mock.call_args_list
+            if len(call.args) >= 2
+        ]
+        self.assertIn("initializing", stages)
+        self.assertIn("mesh_prepare", stages)
+        self.assertIn("bem_solve", stages)
+        self.assertEqual(_jrt.jobs[job_id]["status"], "complete")
+
+
+if __name__ == "__main__":
+    unittest.main()
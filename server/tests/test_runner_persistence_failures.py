@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch
+
+import services.job_runtime as _jrt
+import services.simulation_runner as _sim_runner
+from tests.loop_fixtures import SharedLoopTestCase
+from tests.simulation_fixtures import (
+    construct_valid_request,
+    enable_hornlab_mesher_runtime,
+    running_job_entry,
+    single_triangle_mesher_result,
+)
+
+
+class JobPersistenceFailureSafetyTest(SharedLoopTestCase):
+    """Verify that persistence failures do not leave jobs in false-complete state."""
+
+    def setUp(self):
+        enable_hornlab_mesher_runtime(self)
+
+    def _make_minimal_request(self):
+        return construct_valid_request(
+            num_frequencies=1,
+            solver_backend="metal",
+            options={"mesh": {"strategy": "hornlab_mesher", "waveguide_params": {
+                "formula_type": "OSSE",
+                "wall_thickness": 6.0,
+                "enc_depth": 0.0,
+            }}},
+        )
+
+    def test_results_persistence_failure_leaves_error_not_complete(self):
+        """Job must end in 'error' state (not 'complete') when db.store_results raises."""
+        job_id = "test-persist-fail-status"
+        _jrt.jobs[job_id] = running_job_entry(job_id)
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+
+        def fake_metal_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        with patch.object(_sim_runner, "build_waveguide_mesh", return_value=single_triangle_mesher_result()), \
+             patch.object(_sim_runner, "solve_metal_from_msh", side_effect=fake_metal_solve), \
+             patch.object(_sim_runner.db, "store_results", side_effect=OSError("disk full")):
+            self._run(_sim_runner.run_simulation(job_id, self._make_minimal_request()))
+
+        final_status = _jrt.jobs.get(job_id, {}).get("status")
+        self.assertNotEqual(
+            final_status, "complete",
+            "Job must not be left in 'complete' state when results persistence fails.",
+        )
+        self.assertEqual(
+            final_status, "error",
+            "Job must be in 'error' state when results persistence fails.",
+        )
+
+    def test_results_persistence_failure_error_message_is_safe(self):
+        """Error message on persistence failure must not expose internal exception details."""
+        job_id = "test-persist-fail-msg"
+        _jrt.jobs[job_id] = running_job_entry(job_id)
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+
+        def fake_metal_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        with patch.object(_sim_runner, "build_waveguide_mesh", return_value=single_triangle_mesher_result()), \
+             patch.object(_sim_runner, "solve_metal_from_msh", side_effect=fake_metal_solve), \
+             patch.object(_sim_runner.db, "store_results", side_effect=OSError("disk full")):
+            self._run(_sim_runner.run_simulation(job_id, self._make_minimal_request()))
+
+        error_msg = _jrt.jobs.get(job_id, {}).get("error_message", "")
+        self.assertIsNotNone(error_msg, "Error message must be set on persistence failure.")
+        self.assertNotIn("Traceback", error_msg, "Error message must not contain Python traceback.")
+        self.assertNotIn("OSError", error_msg, "Error message must not expose internal exception class.")
+
+    def test_mesh_artifact_persistence_failure_does_not_abort_simulation(self):
+        """Simulation must complete even if db.store_mesh_artifact raises."""
+        job_id = "test-artifact-persist-fail"
+        _jrt.jobs[job_id] = running_job_entry(job_id)
+        self.addCleanup(_jrt.jobs.pop, job_id, None)
+
+        def fake_metal_solve(*_args, **_kwargs):
+            return {"frequencies": [100.0], "directivity": {}}
+
+        request = construct_valid_request(
+            num_frequencies=1,
+            solver_backend="metal",
+            options={"mesh": {"strategy": "hornlab_mesher", "waveguide_params": {
+                "formula_type": "R-OSSE",
+                "wall_thickness": 6.0,
+                "enc_depth": 0.0,
+            }}},
+        )
+
+        # This payload routes to the circular-symmetric solver, not
+        # solve_metal_from_msh. Patching only the latter left the real
+        # Metal path running, so off macOS the job failed with
+        # MetalBemUnavailable and this test never reached the artifact
+        # persistence behaviour it exists to check. Patch both entry
+        # points so the test is solver- and platform-independent.
+        with patch.object(_sim_runner, "build_waveguide_mesh", return_value=single_triangle_mesher_result()), \
+             patch.object(_sim_runner, "solve_metal_from_msh", side_effect=fake_metal_solve), \
+             patch.object(_sim_runner, "solve_circsym_from_params", side_effect=fake_metal_solve), \
+             patch.object(_sim_runner.db, "store_mesh_artifact", side_effect=OSError("disk full")):
+            self._run(_sim_runner.run_simulation(job_id, request))
+
+        final_status = _jrt.jobs.get(job_id, {}).get("status")
+        self.assertEqual(
+            final_status, "complete",
+            "Simulation must complete even when mesh artifact persistence fails.",
+        )
+        self.assertFalse(
+            _jrt.jobs.get(job_id, {}).get("has_mesh_artifact", True),
+            "has_mesh_artifact must be False when artifact persistence fails.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+import services.job_runtime as _jrt
+from tests.loop_fixtures import SharedLoopTestCase
+
+
+def _set_scheduler_flag(value):
+    with _jrt.jobs_lock:
+        _jrt.scheduler_loop_running = value
+
+
+class SchedulerStateTest(SharedLoopTestCase):
+    """Verify that the scheduler guard is consistent with queue state."""
+
+    def setUp(self):
+        self.addCleanup(_set_scheduler_flag, _jrt.scheduler_loop_running)
+
+    def test_scheduler_skips_when_already_running(self):
+        """_drain_scheduler_queue must exit immediately if scheduler_loop_running is True."""
+        sentinel = "test-sentinel-job-id"
+        _set_scheduler_flag(True)
+        _jrt.job_queue.append(sentinel)
+        self.addCleanup(_jrt._remove_from_queue, sentinel)
+        self._run(_jrt._drain_scheduler_queue())
+        # Sentinel job must still be in the queue — scheduler did not consume it
+        self.assertIn(sentinel, _jrt.job_queue, "Scheduler must not process jobs when already running.")
+
+    def test_scheduler_loop_running_resets_after_empty_queue(self):
+        """scheduler_loop_running must be False after drain completes with empty queue."""
+        _set_scheduler_flag(False)
+
+        self._run(_jrt._drain_scheduler_queue())
+
+        with _jrt.jobs_lock:
+            running = _jrt.scheduler_loop_running
+        self.assertFalse(running, "scheduler_loop_running must be reset to False after drain finishes.")
+
+
+if __name__ == "__main__":
+    unittest.main()
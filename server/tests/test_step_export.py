@@ -21,6 +21,93 @@ _ATH_MUH_CONFIG_PATH = os.environ.get("ATH_MUH_CONFIG")
 ATH_MUH_CONFIG = Path(_ATH_MUH_CONFIG_PATH) if _ATH_MUH_CONFIG_PATH else None
 
 
+def setUpModule():
+    """Open one gmsh session for the whole module.
+
+    ``gmsh.initialize()`` loads the OCC kernel on every call; the STEP writer
+    and the re-import tests reuse this session and only ``gmsh.clear()`` it.
+    """
+    try:
+        import gmsh
+    except ImportError:
+        return
+    if not gmsh.isInitialized():
+        gmsh.initialize(interruptible=False)
+        unittest.addModuleCleanup(gmsh.finalize)
+    gmsh.option.setNumber("General.Terminal", 0)
+
+
+class _FakeGmshOption:
+    def setNumber(self, *_args):
+        return None
+
+
+class _FakeGmshOcc:
+    def __init__(self):
+        self.points = []
+        self.bsplines = []
+        self.wires = []
+        self.thru_sections = []
+        self.removed = []
+
+    def addPoint(self, x, y, z):
+        self.points.append((x, y, z))
+        return len(self.points)
+
+    def addBSpline(self, point_tags):
+        self.bsplines.append(tuple(point_tags))
+        return len(self.bsplines)
+
+    def addWire(self, curve_tags, **kwargs):
+        self.wires.append((tuple(curve_tags), kwargs))
+        return len(self.wires)
+
+    def addThruSections(self, wire_tags, **kwargs):
+        self.thru_sections.append((tuple(wire_tags), kwargs))
+        return [(2, len(self.thru_sections))]
+
+    def remove(self, dim_tags, **kwargs):
+        self.removed.append((tuple(dim_tags), kwargs))
+        return None
+
+    def synchronize(self):
+        return None
+
+
+class _FakeGmshModel:
+    def __init__(self):
+        self.occ = _FakeGmshOcc()
+
+    def add(self, *_args):
+        return None
+
+
+class _FakeGmsh:
+    """Recording stand-in for the gmsh module; ``write`` emits ``step_text``."""
+
+    def __init__(self, step_text):
+        self.model = _FakeGmshModel()
+        self.option = _FakeGmshOption()
+        self.initialized = False
+        self._step_text = step_text
+
+    def isInitialized(self):
+        return self.initialized
+
+    def initialize(self):
+        self.initialized = True
+
+    def clear(self):
+        return None
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(self._step_text)
+
+    def finalize(self):
+        self.initialized = False
+
+
 class StepExportRouteTest(unittest.TestCase):
     def test_step_export_forces_single_layer_payload(self):
         captured_payloads = []
@@ -75,76 +162,12 @@ class StepExportRouteTest(unittest.TestCase):
 
 class StepExportAdapterTest(unittest.TestCase):
     def test_step_writer_exports_bspline_surface_geometry(self):
-        class FakeOption:
-            def setNumber(self, *_args):
-                return None
-
-        class FakeOcc:
-            def __init__(self):
-                self.points = []
-                self.bsplines = []
-                self.wires = []
-                self.thru_sections = []
-                self.removed = []
-
-            def addPoint(self, x, y, z):
-                self.points.append((x, y, z))
-                return len(self.points)
-
-            def addBSpline(self, point_tags):
-                self.bsplines.append(tuple(point_tags))
-                return len(self.bsplines)
-
-            def addWire(self, curve_tags, **kwargs):
-                self.wires.append((tuple(curve_tags), kwargs))
-                return len(self.wires)
-
-            def addThruSections(self, wire_tags, **kwargs):
-                self.thru_sections.append((tuple(wire_tags), kwargs))
-                return [(2, len(self.thru_sections))]
-
-            def remove(self, dim_tags, **kwargs):
-                self.removed.append((tuple(dim_tags), kwargs))
-                return None
-
-            def synchronize(self):
-                return None
-
-        class FakeModel:
-            def __init__(self):
-                self.occ = FakeOcc()
-
-            def add(self, *_args):
-                return None
-
-        class FakeGmsh:
-            def __init__(self):
-                self.model = FakeModel()
-                self.option = FakeOption()
-                self.initialized = False
-
-            def isInitialized(self):
-                return self.initialized
-
-            def initialize(self):
-                self.initialized = True
-
-            def clear(self):
-                return None
-
-            def write(self, path):
-                with open(path, "w", encoding="utf-8") as fh:
-                    fh.write(
-                        "ISO-10303-21;\n"
-                        "#1 = ADVANCED_FACE('',(),#2,.T.);\n"
-                        "#2 = B_SPLINE_SURFACE_WITH_KNOTS('',3,3,(),.UNSPECIFIED.,.F.,.F.,.F.,(),(),.UNSPECIFIED.);\n"
-                        "END-ISO-10303-21;\n"
-                    )
-
-            def finalize(self):
-                self.initialized = False
-
-        fake_gmsh = FakeGmsh()
+        fake_gmsh = _FakeGmsh(
+            "ISO-10303-21;\n"
+            "#1 = ADVANCED_FACE('',(),#2,.T.);\n"
+            "#2 = B_SPLINE_SURFACE_WITH_KNOTS('',3,3,(),.UNSPECIFIED.,.F.,.F.,.F.,(),(),.UNSPECIFIED.);\n"
+            "END-ISO-10303-21;\n"
+        )
         inner_points = np.asarray(
             [
                 [[1.0, 0.0, 0.0], [2.0, 0.0, 10.0], [4.0, 0.0, 20.0]],
@@ -177,58 +200,6 @@ class StepExportAdapterTest(unittest.TestCase):
         self.assertTrue(mouth_ring.issubset(exported_points))
 
     def test_step_writer_rejects_empty_geometry_step(self):
-        class FakeOption:
-            def setNumber(self, *_args):
-                return None
-
-        class FakeOcc:
-            def addPoint(self, *_args):
-                return 1
-
-            def addBSpline(self, *_args, **_kwargs):
-                return 1
-
-            def addWire(self, *_args, **_kwargs):
-                return 1
-
-            def addThruSections(self, *_args, **_kwargs):
-                return [(2, 1)]
-
-            def remove(self, *_args, **_kwargs):
-                return None
-
-            def synchronize(self):
-                return None
-
-        class FakeModel:
-            def __init__(self):
-                self.occ = FakeOcc()
-
-            def add(self, *_args):
-                return None
-
-        class FakeGmsh:
-            def __init__(self):
-                self.model = FakeModel()
-                self.option = FakeOption()
-                self.initialized = False
-
-            def isInitialized(self):
-                return self.initialized
-
-            def initialize(self):
-                self.initialized = True
-
-            def clear(self):
-                return None
-
-            def write(self, path):
-                with open(path, "w", encoding="utf-8") as fh:
-                    fh.write("ISO-10303-21;\nEND-ISO-10303-21;\n")
-
-            def finalize(self):
-                self.initialized = False
-
         inner_points = np.asarray(
             [
                 [[1.0, 0.0, 0.0], [2.0, 0.0, 10.0]],
@@ -238,7 +209,7 @@ class StepExportAdapterTest(unittest.TestCase):
             ]
         )
 
-        with patch.dict(sys.modules, {"gmsh": FakeGmsh()}):
+        with patch.dict(sys.modules, {"gmsh": _FakeGmsh("ISO-10303-21;\nEND-ISO-10303-21;\n")}):
             with self.assertRaisesRegex(RuntimeError, "without surface face geometry"):
                 mesher_adapter._write_inner_surface_step(inner_points)
 
@@ -269,12 +240,7 @@ class StepExportAdapterTest(unittest.TestCase):
         self.assertRegex(step_text, re.compile(r"\b180(?:\.0+)?\b"))
 
         step_path = None
-        initialized_here = False
         try:
-            if not gmsh.isInitialized():
-                gmsh.initialize()
-                initialized_here = True
-            gmsh.option.setNumber("General.Terminal", 0)
             with tempfile.NamedTemporaryFile(prefix="waveguide-step-test-", suffix=".step", delete=False) as tmp:
                 step_path = Path(tmp.name)
             step_path.write_text(step_text, encoding="utf-8")
@@ -290,8 +256,6 @@ class StepExportAdapterTest(unittest.TestCase):
         finally:
             if step_path is not None:
                 step_path.unlink(missing_ok=True)
-            if initialized_here and gmsh.isInitialized():
-                gmsh.finalize()
 
         self.assertTrue(surface_bboxes)
         min_x = min(bbox[0] for bbox in surface_bboxes)
@@ -339,12 +303,7 @@ class StepExportAdapterTest(unittest.TestCase):
         self.assertLessEqual(step_text.count("PRODUCT("), n_length + 2)
 
         step_path = None
-        initialized_here = False
         try:
-            if not gmsh.isInitialized():
-                gmsh.initialize()
-                initialized_here = True
-            gmsh.option.setNumber("General.Terminal", 0)
             with tempfile.NamedTemporaryFile(prefix="waveguide-ath-muh-", suffix=".step", delete=False) as tmp:
                 step_path = Path(tmp.name)
             step_path.write_text(step_text, encoding="utf-8")
@@ -360,8 +319,6 @@ class StepExportAdapterTest(unittest.TestCase):
         finally:
             if step_path is not None:
                 step_path.unlink(missing_ok=True)
-            if initialized_here and gmsh.isInitialized():
-                gmsh.finalize()
 
         self.assertTrue(surface_bboxes)
         min_x = min(bbox[0] for bbox in surface_bboxes)
@@ -712,9 +669,9 @@ class ViewportGeometryAdapterTest(unittest.TestCase):
         # ATH adds CornerSegments to the angular profile budget and rounds the
         # total up to a whole number of points per quadrant (100 + 4 -> 104).
         self.assertEqual((n_phi, n_length), (104, 32))
-        self.assertLess(abs(float(np.max(np.abs(mouth[:, 0]))) - 229.0), 1.0e-6)
-        self.assertLess(abs(float(np.max(np.abs(mouth[:, 1]))) - 204.0), 1.0e-6)
-        self.assertLess(abs(float(np.max(mouth[:, 2])) - 150.0), 1.0e-6)
+        self.assertAlmostEqual(float(np.max(np.abs(mouth[:, 0]))), 229.0, delta=1.0e-6)
+        self.assertAlmostEqual(float(np.max(np.abs(mouth[:, 1]))), 204.0, delta=1.0e-6)
+        self.assertAlmostEqual(float(np.max(mouth[:, 2])), 150.0, delta=1.0e-6)
 
     def test_viewport_geometry_serves_point_grid_without_gmsh(self):
         captured_configs = []
@@ -1,4 +1,3 @@
-import asyncio
 import io
 import tempfile
 import unittest
@@ -15,13 +14,14 @@ from api.routes_misc import (
     workspace_path,
     workspace_select,
 )
+from tests.loop_fixtures import SharedLoopTestCase
 
 
 def make_upload_file(name: str, content: bytes) -> UploadFile:
     return UploadFile(filename=name, file=io.BytesIO(content))
 
 
-class WorkspaceRoutesTest(unittest.TestCase):
+class WorkspaceRoutesTest(SharedLoopTestCase):
     def tearDown(self):
         routes_misc._custom_workspace_path = None
         routes_misc._workspace_path_loaded = False
@@ -30,7 +30,7 @@ class WorkspaceRoutesTest(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             workspace_root = Path(tmpdir).resolve()
             with patch("api.routes_misc._get_default_output_path", return_value=workspace_root):
-                result = asyncio.run(
+                result = self._run(
                     export_file(
                         file=make_upload_file("manual.txt", b"hello workspace"),
                         workspace_subdir="",
@@ -47,7 +47,7 @@ class WorkspaceRoutesTest(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             workspace_root = Path(tmpdir).resolve()
             with patch("api.routes_misc._get_default_output_path", return_value=workspace_root):
-                result = asyncio.run(
+                result = self._run(
                     export_file(
                         file=make_upload_file("bundle.csv", b"freq,spl\n100,90\n"),
                         workspace_subdir="jobs/horn_12",
@@ -64,7 +64,7 @@ class WorkspaceRoutesTest(unittest.TestCase):
             workspace_root = Path(tmpdir).resolve()
             with patch("api.routes_misc._get_default_output_path", return_value=workspace_root):
                 with self.assertRaises(HTTPException) as ctx:
-                    asyncio.run(
+                    self._run(
                         export_file(
                             file=make_upload_file("bad.txt", b"bad"),
                             workspace_subdir="../outside",
@@ -83,7 +83,7 @@ class WorkspaceRoutesTest(unittest.TestCase):
                     "api.routes_misc._get_default_output_path", return_value=workspace_root
                 ):
                     with self.assertRaises(HTTPException) as ctx:
-                        asyncio.run(
+                        self._run(
                             export_file(
                                 file=make_upload_file(filename, b"bad"),
                                 workspace_subdir="",
@@ -104,7 +104,7 @@ class WorkspaceRoutesTest(unittest.TestCase):
 
             with patch("api.routes_misc._get_default_output_path", return_value=workspace_root):
                 with self.assertRaises(HTTPException) as ctx:
-                    asyncio.run(
+                    self._run(
                         export_file(
                             file=make_upload_file("linked.txt", b"bad"),
                             workspace_subdir="",
@@ -118,7 +118,7 @@ class WorkspaceRoutesTest(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             workspace_root = Path(tmpdir).resolve()
             with patch("api.routes_misc._get_default_output_path", return_value=workspace_root):
-                result = asyncio.run(workspace_path())
+                result = self._run(workspace_path())
 
         self.assertEqual(result["path"], str(workspace_root))
 
@@ -137,13 +137,13 @@ class WorkspaceRoutesTest(unittest.TestCase):
                 routes_misc._custom_workspace_path = None
                 routes_misc._workspace_path_loaded = False
 
-                result = asyncio.run(workspace_select())
+                result = self._run(workspace_select())
                 self.assertEqual(result, {"selected": True, "path": str(selected_root)})
                 self.assertTrue(settings_path.exists())
 
                 routes_misc._custom_workspace_path = None
                 routes_misc._workspace_path_loaded = False
-                restored = asyncio.run(workspace_path())
+                restored = self._run(workspace_path())
 
         self.assertEqual(restored["path"], str(selected_root))
 
@@ -153,7 +153,7 @@ class WorkspaceRoutesTest(unittest.TestCase):
             with patch("api.routes_misc._get_default_output_path", return_value=workspace_root), patch(
                 "api.routes_misc.platform.system", return_value="Darwin"
             ), patch("api.routes_misc.subprocess.Popen") as popen:
-                result = asyncio.run(workspace_open())
+                result = self._run(workspace_open())
 
             self.assertTrue(workspace_root.exists())
             popen.assert_called_once_with(["open", str(workspace_root)])
@@ -167,7 +167,7 @@ class WorkspaceRoutesTest(unittest.TestCase):
             with patch("api.routes_misc.asyncio.to_thread", to_thread), patch(
                 "api.routes_misc._persist_workspace_path_preference"
             ):
-                result = asyncio.run(workspace_select())
+                result = self._run(workspace_select())
 
         to_thread.assert_awaited_once_with(routes_misc._select_workspace_folder)
         self.assertEqual(result, {"selected": True, "path": str(selected_root)})